@@ -0,0 +1,76 @@
+"""Compare :class:`JpsSolver` with :class:`BfsSolver` on random open boards.
+
+    python benchmarks/jps.py [--sizes 50 150 300] [--density 0.05] [--boards 3] [--seed 7]
+
+Every board is solved by both solvers. The script prints the best wall-clock time
+and the number of expanded nodes of each solver, and exits with a non-zero status
+when JPS finds a different path length or is slower than BFS.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Optional, Sequence
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from robot_bouncer.core.engine import BounceRule, GameEngine, GameState  # noqa: E402
+from robot_bouncer.core.entities import Board, Direction, Position, Robot  # noqa: E402
+from robot_bouncer.solver.bfs import BfsSolver  # noqa: E402
+from robot_bouncer.solver.jps import JpsSolver  # noqa: E402
+
+
+def random_state(size: int, density: float, rng: random.Random, list_walls: bool) -> GameState:
+    start, goal = Position(0, 0), Position(size - 1, size - 1)
+    walls = {
+        Position(x, y)
+        for x in range(size)
+        for y in range(size)
+        if rng.random() < density and Position(x, y) not in (start, goal)
+    }
+    board = Board(width=size, height=size, walls=list(walls) if list_walls else walls)
+    return GameState(board=board, robot=Robot(position=start, direction=Direction.EAST), goals=[goal])
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare JPS with BFS on random boards.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 150, 300])
+    parser.add_argument("--density", type=float, default=0.05, help="Probability of a tile being a wall.")
+    parser.add_argument("--boards", type=int, default=3, help="Random boards per size.")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--list-walls", action="store_true", help="Store walls as a list like Board's default.")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    engine = GameEngine(rules=[BounceRule()])
+    failed = False
+    print(f"{'size':>5} {'bfs ms':>9} {'bfs nodes':>10} {'jps ms':>9} {'jps nodes':>10} {'speed-up':>9}")
+    for size in args.sizes:
+        bfs_time = jps_time = 0.0
+        bfs_nodes = jps_nodes = 0
+        for _ in range(args.boards):
+            state = random_state(size, args.density, rng, args.list_walls)
+            started = time.perf_counter()
+            bfs = BfsSolver(engine).solve(state)
+            bfs_time += time.perf_counter() - started
+            started = time.perf_counter()
+            jps = JpsSolver(engine).solve(state)
+            jps_time += time.perf_counter() - started
+            bfs_nodes += bfs.explored
+            jps_nodes += jps.explored
+            if (bfs.success, bfs.moves) != (jps.success, jps.moves):
+                failed = True
+                print(f"path mismatch on {size}x{size}: bfs {bfs.moves} moves, jps {jps.moves} moves")
+        failed |= jps_time > bfs_time
+        print(
+            f"{size:>5} {bfs_time * 1000:9.1f} {bfs_nodes:>10} {jps_time * 1000:9.1f} {jps_nodes:>10}"
+            f" {bfs_time / jps_time:8.1f}x"
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
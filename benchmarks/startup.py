@@ -0,0 +1,105 @@
+"""Startup-time benchmark for the ``robot-bouncer`` command.
+
+Each scenario runs in a fresh interpreter, so module caches never hide import
+costs. The interpreter's own start-up (``python -c pass``) is measured the same
+way and subtracted, and the best of several runs is compared with a fixed budget.
+
+    python benchmarks/startup.py [--runs 7] [--import-budget 0.03] [--solve-budget 0.2]
+
+The script exits with a non-zero status when a scenario goes over its budget or
+when a cold import loads a module that should only be imported on demand.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that must not be imported until a command selects them.
+DEFERRED_MODULES = (
+    "robot_bouncer.app",
+    "robot_bouncer.core",
+    "robot_bouncer.solver",
+    "robot_bouncer.visuals",
+    "robot_bouncer.interfaces",
+    "robot_bouncer.generator",
+    "asyncio",
+    "dataclasses",
+    "typing",
+    "argparse",
+)
+
+_CHECK_DEFERRED = (
+    "import sys, robot_bouncer.cli; "
+    "loaded = [name for name in {modules!r} if name in sys.modules]; "
+    "print(','.join(loaded))"
+)
+
+
+def _environment() -> dict:
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), environment.get("PYTHONPATH")]))
+    environment.pop("PYTHONSTARTUP", None)
+    return environment
+
+
+def best_time(command: Sequence[str], runs: int) -> float:
+    """Return the fastest wall-clock time of ``runs`` executions of ``command``."""
+
+    environment = _environment()
+    timings: List[float] = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(command, check=True, env=environment, stdout=subprocess.DEVNULL, cwd=ROOT)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def deferred_modules_loaded() -> List[str]:
+    command = [sys.executable, "-c", _CHECK_DEFERRED.format(modules=DEFERRED_MODULES)]
+    output = subprocess.run(command, check=True, env=_environment(), capture_output=True, text=True, cwd=ROOT)
+    return [name for name in output.stdout.strip().split(",") if name]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Check the start-up time of the robot-bouncer command.")
+    parser.add_argument("--runs", type=int, default=7, help="Runs per scenario; the best one is kept.")
+    parser.add_argument("--import-budget", type=float, default=0.03, help="Seconds allowed for a cold import.")
+    parser.add_argument("--solve-budget", type=float, default=0.2, help="Seconds allowed for a trivial solve.")
+    args = parser.parse_args(argv)
+
+    python = [sys.executable]
+    baseline = best_time([*python, "-c", "pass"], args.runs)
+    scenarios = [
+        ("cold import", [*python, "-c", "import robot_bouncer.cli"], args.import_budget),
+        (
+            "trivial solve",
+            [*python, "-m", "robot_bouncer", "solve", "--width", "5", "--height", "5", "--renderer", "none"],
+            args.solve_budget,
+        ),
+    ]
+
+    failed = False
+    print(f"{'interpreter':<14} {baseline * 1000:8.1f} ms")
+    for name, command, budget in scenarios:
+        elapsed = max(0.0, best_time(command, args.runs) - baseline)
+        within = elapsed <= budget
+        failed |= not within
+        status = "ok" if within else "OVER BUDGET"
+        print(f"{name:<14} {elapsed * 1000:8.1f} ms  (budget {budget * 1000:.0f} ms)  {status}")
+
+    loaded = deferred_modules_loaded()
+    if loaded:
+        failed = True
+        print("cold import loaded deferred modules: " + ", ".join(loaded))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
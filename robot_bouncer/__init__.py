@@ -1,4 +1,13 @@
 """Robot Bouncer game framework."""
-from .app import GameConfig, RobotBouncerApp
+from __future__ import annotations
+
+from ._lazy import lazy_exports
+
+# A local flag instead of typing.TYPE_CHECKING keeps typing out of cold imports.
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from .app import GameConfig, RobotBouncerApp
 
 __all__ = ["GameConfig", "RobotBouncerApp"]
+__getattr__, __dir__ = lazy_exports(__name__, {"GameConfig": ".app", "RobotBouncerApp": ".app"})
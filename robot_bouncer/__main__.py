@@ -0,0 +1,5 @@
+import sys
+
+from robot_bouncer.cli import main
+
+sys.exit(main())
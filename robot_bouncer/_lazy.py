@@ -0,0 +1,32 @@
+"""Helpers for deferring subsystem imports until they are first used."""
+from __future__ import annotations
+
+from importlib import import_module
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+
+def lazy_exports(package: str, exports: Mapping[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build module-level ``__getattr__`` and ``__dir__`` resolving ``exports`` on demand.
+
+    ``exports`` maps each public name to the module defining it, relative to
+    ``package``. Resolved values are cached in the package namespace, so each name
+    only pays for its import once.
+    """
+
+    namespace: Dict[str, Any] = vars(import_module(package))
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted({*namespace, *exports})
+
+    return __getattr__, __dir__
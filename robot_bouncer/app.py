@@ -2,14 +2,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List, Optional
+from typing import TYPE_CHECKING, Iterable, Optional
 
 from robot_bouncer.core.engine import BounceRule, GameEngine, GameState
-from robot_bouncer.core.entities import Board, Position, Robot
-from robot_bouncer.visuals.base import GameRenderer
-from robot_bouncer.visuals.console import ConsoleRenderer
-from robot_bouncer.solver.base import GameSolver
-from robot_bouncer.solver.bfs import BfsSolver
+from robot_bouncer.core.entities import Board, Direction, Position, Robot
+
+if TYPE_CHECKING:
+    from robot_bouncer.solver.base import GameSolver, SearchBudget
+    from robot_bouncer.visuals.base import GameRenderer
 
 
 @dataclass
@@ -30,7 +30,11 @@ class RobotBouncerApp:
         renderer: Optional[GameRenderer] = None,
         solver: Optional[GameSolver] = None,
     ) -> None:
-        self.renderer = renderer or ConsoleRenderer()
+        if renderer is None:
+            from robot_bouncer.visuals.console import ConsoleRenderer
+
+            renderer = ConsoleRenderer()
+        self.renderer = renderer
         self.solver = solver
 
     def create_state(self, config: GameConfig) -> GameState:
@@ -44,22 +48,26 @@ class RobotBouncerApp:
         goals = list(config.goals or [Position(config.width - 1, config.height - 1)])
         return GameState(board=board, robot=robot, goals=goals)
 
-    def _default_direction(self, config: GameConfig):
-        from robot_bouncer.core.entities import Direction
-
+    def _default_direction(self, config: GameConfig) -> Direction:
         return Direction.EAST if config.width > 1 else Direction.SOUTH
 
     def build_engine(self) -> GameEngine:
         return GameEngine(rules=[BounceRule()])
 
     def ensure_solver(self, engine: GameEngine) -> GameSolver:
-        return self.solver or BfsSolver(engine)
+        if self.solver is not None:
+            return self.solver
+        from robot_bouncer.solver.bfs import BfsSolver
 
-    def run(self, config: GameConfig) -> GameState:
+        return BfsSolver(engine)
+
+    def run(self, config: GameConfig, budget: Optional[SearchBudget] = None) -> GameState:
         state = self.create_state(config)
         engine = self.build_engine()
         solver = self.ensure_solver(engine)
-        result = solver.solve(state)
+        from robot_bouncer.solver.base import solve_within
+
+        result = solve_within(solver, state, budget)
         solver.apply_solution(state, result)
         commands = result.to_commands()
         computation_details = result.to_computation_details()
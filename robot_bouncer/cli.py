@@ -0,0 +1,134 @@
+"""Command-line entry point for Robot Bouncer.
+
+Importing this module costs next to nothing: :mod:`argparse` is loaded when the
+command line is parsed, positions are parsed as plain tuples, and the game
+modules, solvers, renderers and other subcommands are imported once they are
+selected, so short-lived worker processes start quickly.
+"""
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import argparse
+    from typing import List, Optional, Sequence, Tuple
+
+
+def _position(text: str) -> Tuple[int, int]:
+    import argparse
+
+    try:
+        x, y = (int(part) for part in text.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected a position as 'x,y', got {text!r}.") from None
+    return x, y
+
+
+def _solve(args: argparse.Namespace) -> int:
+    from robot_bouncer.app import GameConfig, RobotBouncerApp
+    from robot_bouncer.core.entities import Position
+    from robot_bouncer.registry import load_renderer, load_solver
+    from robot_bouncer.solver.base import SearchBudget, solve_within
+
+    def positions(pairs: Optional[List[Tuple[int, int]]]) -> Optional[List[Position]]:
+        return None if pairs is None else [Position(x, y) for x, y in pairs]
+
+    config = GameConfig(
+        width=args.width,
+        height=args.height,
+        walls=positions(args.wall),
+        pads=positions(args.pad),
+        goals=positions(args.goal),
+        robot_start=Position(*args.start),
+    )
+    renderer = None if args.renderer == "none" else load_renderer(args.renderer)()
+    app = RobotBouncerApp(renderer=renderer)
+    state = app.create_state(config)
+    solver = load_solver(args.solver)(app.build_engine())
+
+    budget = None
+    if args.time_limit is not None or args.max_nodes is not None:
+        budget = SearchBudget(time_limit=args.time_limit, max_nodes=args.max_nodes)
+    result = solve_within(solver, state, budget)
+    solver.apply_solution(state, result)
+
+    commands = result.iter_run_commands() if args.run_length else result.iter_commands()
+    lines: List[str] = [*result.to_computation_details(), *commands]
+    if renderer is None:
+        sys.stdout.write("\n".join(lines) + "\n")
+    else:
+        renderer.display_with_commands(state, lines)
+    return 0 if result.success else 1
+
+
+def _list(args: argparse.Namespace) -> int:
+    from robot_bouncer.registry import available_renderers, available_solvers
+
+    print("Solvers:   " + ", ".join(available_solvers()))
+    print("Renderers: " + ", ".join(available_renderers()) + ", none")
+    return 0
+
+
+def _serve(args: argparse.Namespace) -> int:
+    from robot_bouncer.interfaces.service import main as serve_main
+
+    serve_main(args.options, prog="robot-bouncer serve")
+    return 0
+
+
+def _generate(args: argparse.Namespace) -> int:
+    from robot_bouncer.generator import main as generate_main
+
+    generate_main(args.options, prog="robot-bouncer generate")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="robot-bouncer", description="Robot Bouncer command-line tools.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    solve = commands.add_parser("solve", help="Solve a board and print the commands.")
+    solve.add_argument("--width", type=int, default=5)
+    solve.add_argument("--height", type=int, default=5)
+    solve.add_argument("--wall", type=_position, action="append", metavar="X,Y", help="Add a wall (repeatable).")
+    solve.add_argument("--pad", type=_position, action="append", metavar="X,Y", help="Add a bounce pad (repeatable).")
+    solve.add_argument("--goal", type=_position, action="append", metavar="X,Y", help="Add a goal (repeatable).")
+    solve.add_argument("--start", type=_position, default=(0, 0), metavar="X,Y")
+    solve.add_argument("--solver", default="bfs", help="Solver name, see 'robot-bouncer list'.")
+    solve.add_argument("--renderer", default="console", help="Renderer name, or 'none' to skip rendering.")
+    solve.add_argument("--time-limit", type=float, default=None, help="Search budget in seconds.")
+    solve.add_argument("--max-nodes", type=int, default=None, help="Search budget in expanded nodes.")
+    solve.add_argument("--run-length", action="store_true", help="Print one command per straight run.")
+    solve.set_defaults(handler=_solve)
+
+    listing = commands.add_parser("list", help="List the registered solvers and renderers.")
+    listing.set_defaults(handler=_list)
+
+    serve = commands.add_parser("serve", help="Run the JSON-lines solve service.", add_help=False)
+    serve.set_defaults(handler=_serve, passthrough=True)
+
+    generate = commands.add_parser("generate", help="Generate a puzzle corpus.", add_help=False)
+    generate.set_defaults(handler=_generate, passthrough=True)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = build_parser()
+    args, options = parser.parse_known_args(argv)
+    if options and not getattr(args, "passthrough", False):
+        parser.error("unrecognized arguments: " + " ".join(options))
+    args.options = options
+    from robot_bouncer.registry import UnknownEntryError
+
+    try:
+        return args.handler(args)
+    except UnknownEntryError as error:
+        print(error, file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,13 @@
 """Core mechanics for Robot Bouncer."""
-from .engine import GameEngine, GameState, BounceRule
-from .entities import Board, Robot, Position, Direction
+from __future__ import annotations
+
+from robot_bouncer._lazy import lazy_exports
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .engine import BounceRule, GameEngine, GameState
+    from .entities import Board, Direction, Position, Robot
+    from .trace import TraceReader, TraceRecorder, record_run
 
 __all__ = [
     "GameEngine",
@@ -10,4 +17,22 @@ __all__ = [
     "Robot",
     "Position",
     "Direction",
+    "TraceReader",
+    "TraceRecorder",
+    "record_run",
 ]
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "GameEngine": ".engine",
+        "GameState": ".engine",
+        "BounceRule": ".engine",
+        "Board": ".entities",
+        "Robot": ".entities",
+        "Position": ".entities",
+        "Direction": ".entities",
+        "TraceReader": ".trace",
+        "TraceRecorder": ".trace",
+        "record_run": ".trace",
+    },
+)
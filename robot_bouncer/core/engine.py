@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List, Protocol
+from typing import FrozenSet, Iterable, List, Protocol, Sequence
 
 from .entities import Board, Direction, Position, Robot
 
@@ -16,14 +16,32 @@ class Rule(Protocol):
 
 @dataclass
 class GameState:
-    """Complete snapshot of the game."""
+    """Complete snapshot of the game.
+
+    ``goals`` is always stored as a tuple: any sequence assigned to it, including
+    through the constructor, is converted and the goal set is rebuilt at the same
+    time. Tuples cannot be changed in place, so :attr:`goal_set` never goes stale;
+    add a goal by assignment, e.g. ``state.goals = [*state.goals, goal]``.
+    """
 
     board: Board
     robot: Robot
-    goals: List[Position]
+    goals: Sequence[Position]
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if name == "goals":
+            value = tuple(value)
+            object.__setattr__(self, "_goal_set", frozenset(value))
+        object.__setattr__(self, name, value)
+
+    @property
+    def goal_set(self) -> FrozenSet[Position]:
+        """Return the goals as a set for constant-time membership tests."""
+
+        return self._goal_set
 
     def is_goal_reached(self) -> bool:
-        return self.robot.position in self.goals
+        return self.robot.position in self._goal_set
 
 
 class GameEngine:
@@ -63,7 +81,9 @@ class BounceRule:
     def _bounce(direction: Direction) -> Direction:
         horizontal = {Direction.EAST: Direction.WEST, Direction.WEST: Direction.EAST}
         vertical = {Direction.NORTH: Direction.SOUTH, Direction.SOUTH: Direction.NORTH}
-        return horizontal.get(direction, vertical[direction])
+        if direction in horizontal:
+            return horizontal[direction]
+        return vertical[direction]
 
 
 class GoalRule:
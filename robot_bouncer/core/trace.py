@@ -0,0 +1,220 @@
+"""Compact binary traces of engine runs with checkpointed random access.
+
+Layout of a trace file::
+
+    header      b"RBTR", version, checkpoint interval, JSON metadata (board and goals)
+    segments    one per checkpoint interval: a full-state checkpoint followed by deltas
+    index       byte offset of every checkpoint
+    trailer     index offset, number of recorded steps, b"RBTI"
+
+A delta is a single byte packing ``dx + 1`` and ``dy + 1`` in two bits each and the
+direction code in the next two bits. Moves longer than one tile are written as a
+full-state escape record. Seeking to step ``n`` is one index lookup plus the replay
+of at most ``checkpoint_interval - 1`` records.
+"""
+from __future__ import annotations
+
+import json
+import struct
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .engine import GameEngine, GameState
+from .entities import Board, Direction, Position, Robot
+
+MAGIC = b"RBTR"
+INDEX_MAGIC = b"RBTI"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sBII")
+_FULL_STATE = struct.Struct("<Biib")
+_OFFSET = struct.Struct("<Q")
+_TRAILER = struct.Struct("<QQ4s")
+_CHECKPOINT = 0xFF
+_ESCAPE = 0xFE
+
+_DIRECTIONS: List[Direction] = list(Direction)
+_DIRECTION_CODES = {direction: code for code, direction in enumerate(_DIRECTIONS)}
+
+TraceState = Tuple[Position, Direction]
+
+
+class TraceRecorder:
+    """Append robot states to a binary trace file."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        board: Board,
+        goals: Iterable[Position],
+        checkpoint_interval: int = 1024,
+    ):
+        if checkpoint_interval < 1:
+            raise ValueError("Checkpoint interval must be at least 1.")
+        self.checkpoint_interval = checkpoint_interval
+        self.steps = 0
+        self._offsets: List[int] = []
+        self._last: Optional[TraceState] = None
+        self._file: BinaryIO = open(path, "wb")
+        metadata = json.dumps(
+            {
+                "width": board.width,
+                "height": board.height,
+                "walls": [[wall.x, wall.y] for wall in board.walls],
+                "pads": [[pad.x, pad.y] for pad in board.bounce_pads],
+                "goals": [[goal.x, goal.y] for goal in goals],
+            }
+        ).encode()
+        self._file.write(_HEADER.pack(MAGIC, VERSION, checkpoint_interval, len(metadata)))
+        self._file.write(metadata)
+
+    def __enter__(self) -> "TraceRecorder":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def record(self, state: GameState) -> None:
+        position = state.robot.position
+        direction = state.robot.direction
+        write = self._file.write
+        if self.steps % self.checkpoint_interval == 0:
+            self._offsets.append(self._file.tell())
+            write(_FULL_STATE.pack(_CHECKPOINT, position.x, position.y, _DIRECTION_CODES[direction]))
+        else:
+            previous = self._last[0]
+            dx = position.x - previous.x
+            dy = position.y - previous.y
+            if -1 <= dx <= 1 and -1 <= dy <= 1:
+                write(bytes(((dx + 1) | (dy + 1) << 2 | _DIRECTION_CODES[direction] << 4,)))
+            else:
+                write(_FULL_STATE.pack(_ESCAPE, position.x, position.y, _DIRECTION_CODES[direction]))
+        self._last = (position, direction)
+        self.steps += 1
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        index_offset = self._file.tell()
+        for offset in self._offsets:
+            self._file.write(_OFFSET.pack(offset))
+        self._file.write(_TRAILER.pack(index_offset, self.steps, INDEX_MAGIC))
+        self._file.close()
+
+
+class TraceReader:
+    """Random-access reader for traces written by :class:`TraceRecorder`."""
+
+    def __init__(self, path: Union[str, Path]):
+        self._file: BinaryIO = open(path, "rb")
+        magic, version, interval, metadata_size = _HEADER.unpack(self._file.read(_HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a Robot Bouncer trace file.")
+        self.checkpoint_interval = interval
+        metadata = json.loads(self._file.read(metadata_size))
+        self.board = Board(
+            width=metadata["width"],
+            height=metadata["height"],
+            walls=[Position(x, y) for x, y in metadata["walls"]],
+            bounce_pads=[Position(x, y) for x, y in metadata["pads"]],
+        )
+        self.goals = [Position(x, y) for x, y in metadata["goals"]]
+
+        self._file.seek(-_TRAILER.size, 2)
+        self._index_offset, self.steps, index_magic = _TRAILER.unpack(self._file.read(_TRAILER.size))
+        if index_magic != INDEX_MAGIC:
+            raise ValueError("Trace file is truncated or was not closed.")
+        self._file.seek(self._index_offset)
+        checkpoints = (self.steps + interval - 1) // interval
+        raw = self._file.read(checkpoints * _OFFSET.size)
+        self._offsets = [offset for (offset,) in _OFFSET.iter_unpack(raw)]
+
+    def __enter__(self) -> "TraceReader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.steps
+
+    def __getitem__(self, step: int) -> GameState:
+        return self.state_at(step)
+
+    def state_at(self, step: int) -> GameState:
+        """Return the state recorded at ``step`` (0 is the first recorded state)."""
+
+        if step < 0:
+            step += self.steps
+        if not 0 <= step < self.steps:
+            raise IndexError("Trace step out of range.")
+        segment = step // self.checkpoint_interval
+        for offset, state in enumerate(self._decode_segment(segment)):
+            if offset == step - segment * self.checkpoint_interval:
+                return self._snapshot(state)
+        raise ValueError("Trace segment is shorter than its index claims.")
+
+    def iter_states(self, start: int = 0, stop: Optional[int] = None) -> Iterator[GameState]:
+        """Yield states from ``start`` up to ``stop`` as a frame stream."""
+
+        stop = self.steps if stop is None else min(stop, self.steps)
+        if start >= stop:
+            return
+        step = start - start % self.checkpoint_interval
+        segment = start // self.checkpoint_interval
+        while step < stop:
+            for state in self._decode_segment(segment):
+                if step >= stop:
+                    return
+                if step >= start:
+                    yield self._snapshot(state)
+                step += 1
+            segment += 1
+
+    def close(self) -> None:
+        self._file.close()
+
+    def _decode_segment(self, segment: int) -> Iterator[TraceState]:
+        start = self._offsets[segment]
+        end = self._offsets[segment + 1] if segment + 1 < len(self._offsets) else self._index_offset
+        self._file.seek(start)
+        data = self._file.read(end - start)
+
+        cursor = 0
+        x = y = 0
+        direction = _DIRECTIONS[0]
+        while cursor < len(data):
+            tag = data[cursor]
+            if tag >= _ESCAPE:
+                _, x, y, code = _FULL_STATE.unpack_from(data, cursor)
+                direction = _DIRECTIONS[code]
+                cursor += _FULL_STATE.size
+            else:
+                x += (tag & 0b11) - 1
+                y += (tag >> 2 & 0b11) - 1
+                direction = _DIRECTIONS[tag >> 4 & 0b11]
+                cursor += 1
+            yield Position(x, y), direction
+
+    def _snapshot(self, state: TraceState) -> GameState:
+        position, direction = state
+        return GameState(board=self.board, robot=Robot(position=position, direction=direction), goals=self.goals)
+
+
+def record_run(
+    engine: GameEngine,
+    state: GameState,
+    path: Union[str, Path],
+    max_steps: int = 100,
+    checkpoint_interval: int = 1024,
+) -> GameState:
+    """Run the engine like :meth:`GameEngine.run_until_goal`, recording every step."""
+
+    with TraceRecorder(path, state.board, state.goals, checkpoint_interval) as recorder:
+        recorder.record(state)
+        for _ in range(max_steps):
+            engine.step(state)
+            recorder.record(state)
+            if state.is_goal_reached():
+                break
+    return state
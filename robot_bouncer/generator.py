@@ -0,0 +1,365 @@
+"""Seeded puzzle generator producing solvable boards with a target solution depth."""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from heapq import heappop, heappush
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from robot_bouncer.app import GameConfig
+from robot_bouncer.core.entities import Position
+
+_UNREACHED = -1
+
+
+class DistanceField:
+    """BFS distances from a single source, updated incrementally as walls change.
+
+    Tiles are stored as flat indices ``y * width + x``. Adding a wall only recomputes
+    the tiles whose every shortest path went through it, and removing a wall only
+    relaxes outwards from the reopened tile. Every edit returns an undo log, so a
+    rejected mutation can be rolled back without searching again.
+    """
+
+    def __init__(self, width: int, height: int, source: Position, walls: Iterable[Position] = ()):
+        self.width = width
+        self.height = height
+        self.source = source.y * width + source.x
+        self.walls = bytearray(width * height)
+        for wall in walls:
+            self.walls[wall.y * width + wall.x] = 1
+        self.distances = [_UNREACHED] * (width * height)
+        self._layers = [0] * (width * height)
+        self._farthest = 0
+        self._neighbours = [self._compute_neighbours(index) for index in range(width * height)]
+        self._flood()
+
+    @property
+    def max_distance(self) -> int:
+        layers = self._layers
+        while self._farthest > 0 and not layers[self._farthest]:
+            self._farthest -= 1
+        return self._farthest if layers[self._farthest] else _UNREACHED
+
+    def is_wall(self, index: int) -> bool:
+        return bool(self.walls[index])
+
+    def tiles_at(self, distance: int) -> List[Position]:
+        return [
+            Position(index % self.width, index // self.width)
+            for index, value in enumerate(self.distances)
+            if value == distance
+        ]
+
+    def add_wall(self, index: int) -> Dict[int, int]:
+        """Turn ``index`` into a wall and return the undo log of changed distances."""
+
+        distances = self.distances
+        neighbours = self._neighbours
+        self.walls[index] = 1
+        if distances[index] == _UNREACHED:
+            return {}
+
+        affected = {index}
+        level = distances[index] + 1
+        current = [tile for tile in neighbours[index] if distances[tile] == level]
+        while current:
+            following: List[int] = []
+            for tile in current:
+                if tile in affected:
+                    continue
+                if any(
+                    distances[parent] == level - 1 and parent not in affected
+                    for parent in neighbours[tile]
+                ):
+                    continue
+                affected.add(tile)
+                following.extend(child for child in neighbours[tile] if distances[child] == level + 1)
+            current = following
+            level += 1
+
+        log = {tile: distances[tile] for tile in affected}
+        for tile in affected:
+            self._set(tile, _UNREACHED)
+
+        heap: List[tuple] = []
+        for tile in affected:
+            if tile == index:
+                continue
+            reached = [distances[parent] for parent in neighbours[tile] if distances[parent] != _UNREACHED]
+            if reached:
+                heappush(heap, (min(reached) + 1, tile))
+        while heap:
+            distance, tile = heappop(heap)
+            if distances[tile] != _UNREACHED:
+                continue
+            self._set(tile, distance)
+            for child in neighbours[tile]:
+                if child in affected and distances[child] == _UNREACHED and not self.walls[child]:
+                    heappush(heap, (distance + 1, child))
+        return log
+
+    def remove_wall(self, index: int) -> Dict[int, int]:
+        """Reopen the wall at ``index`` and return the undo log of changed distances."""
+
+        distances = self.distances
+        neighbours = self._neighbours
+        self.walls[index] = 0
+        reached = [distances[tile] for tile in neighbours[index] if distances[tile] != _UNREACHED]
+        if not reached:
+            return {}
+
+        log = {index: distances[index]}
+        self._set(index, min(reached) + 1)
+        queue = deque([index])
+        while queue:
+            tile = queue.popleft()
+            candidate = distances[tile] + 1
+            for child in neighbours[tile]:
+                if self.walls[child]:
+                    continue
+                if distances[child] == _UNREACHED or distances[child] > candidate:
+                    log.setdefault(child, distances[child])
+                    self._set(child, candidate)
+                    queue.append(child)
+        return log
+
+    def undo(self, index: int, log: Dict[int, int]) -> None:
+        """Roll back the wall toggle at ``index`` using the log returned by the edit."""
+
+        self.walls[index] ^= 1
+        for tile, distance in log.items():
+            self._set(tile, distance)
+
+    def _set(self, tile: int, distance: int) -> None:
+        previous = self.distances[tile]
+        if previous != _UNREACHED:
+            self._layers[previous] -= 1
+        if distance != _UNREACHED:
+            self._layers[distance] += 1
+            if distance > self._farthest:
+                self._farthest = distance
+        self.distances[tile] = distance
+
+    def _flood(self) -> None:
+        if self.walls[self.source]:
+            return
+        self._set(self.source, 0)
+        queue = deque([self.source])
+        while queue:
+            tile = queue.popleft()
+            for child in self._neighbours[tile]:
+                if not self.walls[child] and self.distances[child] == _UNREACHED:
+                    self._set(child, self.distances[tile] + 1)
+                    queue.append(child)
+
+    def _compute_neighbours(self, index: int) -> List[int]:
+        x, y = index % self.width, index // self.width
+        neighbours: List[int] = []
+        if y > 0:
+            neighbours.append(index - self.width)
+        if y < self.height - 1:
+            neighbours.append(index + self.width)
+        if x < self.width - 1:
+            neighbours.append(index + 1)
+        if x > 0:
+            neighbours.append(index - 1)
+        return neighbours
+
+
+@dataclass
+class Puzzle:
+    """A generated board whose optimal BFS solution is exactly ``depth`` moves long."""
+
+    seed: int
+    width: int
+    height: int
+    depth: int
+    robot_start: Position
+    goals: List[Position] = field(default_factory=list)
+    walls: List[Position] = field(default_factory=list)
+
+    def to_config(self) -> GameConfig:
+        return GameConfig(
+            width=self.width,
+            height=self.height,
+            walls=list(self.walls),
+            goals=list(self.goals),
+            robot_start=self.robot_start,
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "seed": self.seed,
+                "depth": self.depth,
+                "width": self.width,
+                "height": self.height,
+                "robot_start": [self.robot_start.x, self.robot_start.y],
+                "goals": [[goal.x, goal.y] for goal in self.goals],
+                "walls": [[wall.x, wall.y] for wall in self.walls],
+            }
+        )
+
+
+class PuzzleGenerator:
+    """Generate boards by mutating walls while tracking BFS distances incrementally.
+
+    Walls are toggled on random tiles. A mutation is rolled back when it would leave
+    no reachable tile at the requested depth, or when it shortens the farthest
+    reachable distance before that depth has been reached. Once enough walls are
+    placed, the goal is drawn among the tiles at exactly ``depth`` moves from the
+    start. This guarantees both solvability and the optimal solution length.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        depth: int,
+        wall_density: float = 0.25,
+        max_mutations: Optional[int] = None,
+        attempts: int = 8,
+    ):
+        if depth < 1 or depth > width * height - 1:
+            raise ValueError("Depth must be between 1 and the number of tiles minus one.")
+        if not 0.0 <= wall_density < 1.0:
+            raise ValueError("Wall density must be in [0, 1).")
+        self.width = width
+        self.height = height
+        self.depth = depth
+        self.wall_density = wall_density
+        self.max_mutations = max_mutations or 20 * width * height
+        self.attempts = attempts
+
+    def generate(self, seed: int) -> Puzzle:
+        puzzle = self.try_generate(seed)
+        if puzzle is None:
+            raise RuntimeError(f"Could not reach depth {self.depth} for seed {seed}.")
+        return puzzle
+
+    def try_generate(self, seed: int) -> Optional[Puzzle]:
+        """Like :meth:`generate`, but return ``None`` when every attempt fails."""
+
+        rng = random.Random(seed)
+        for _ in range(self.attempts):
+            puzzle = self._attempt(seed, rng)
+            if puzzle is not None:
+                return puzzle
+        return None
+
+    def _attempt(self, seed: int, rng: random.Random) -> Optional[Puzzle]:
+        tiles = self.width * self.height
+        start = Position(rng.randrange(self.width), rng.randrange(self.height))
+        start_index = start.y * self.width + start.x
+        distance_field = DistanceField(self.width, self.height, start)
+        target_walls = int(self.wall_density * tiles)
+        wall_count = 0
+
+        for _ in range(self.max_mutations):
+            farthest = distance_field.max_distance
+            if farthest >= self.depth and wall_count >= target_walls:
+                break
+            index = rng.randrange(tiles)
+            if index == start_index:
+                continue
+            if distance_field.is_wall(index):
+                if wall_count <= target_walls and farthest >= self.depth:
+                    continue
+                log = distance_field.remove_wall(index)
+                change = -1
+            else:
+                log = distance_field.add_wall(index)
+                change = 1
+            if distance_field.max_distance < min(self.depth, farthest):
+                distance_field.undo(index, log)
+                continue
+            wall_count += change
+
+        if distance_field.max_distance < self.depth:
+            return None
+        goal = rng.choice(distance_field.tiles_at(self.depth))
+        walls = [
+            Position(index % self.width, index // self.width)
+            for index in range(tiles)
+            if distance_field.is_wall(index)
+        ]
+        return Puzzle(
+            seed=seed,
+            width=self.width,
+            height=self.height,
+            depth=self.depth,
+            robot_start=start,
+            goals=[goal],
+            walls=walls,
+        )
+
+
+def iter_puzzles(
+    generator: PuzzleGenerator,
+    count: int,
+    seed: int = 0,
+    workers: Optional[int] = None,
+) -> Iterator[Puzzle]:
+    """Generate puzzles for ``count`` seeds across a process pool, in seed order.
+
+    Seeds for which no puzzle reaches the requested depth are skipped, so fewer than
+    ``count`` puzzles may be yielded.
+    """
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, count // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for puzzle in executor.map(generator.try_generate, range(seed, seed + count), chunksize=chunksize):
+            if puzzle is not None:
+                yield puzzle
+
+
+def generate_corpus(
+    path: Union[str, Path],
+    generator: PuzzleGenerator,
+    count: int,
+    seed: int = 0,
+    workers: Optional[int] = None,
+) -> int:
+    """Stream puzzles for ``count`` seeds to ``path`` as JSON lines.
+
+    Returns how many puzzles were written; seeds that failed to generate are skipped.
+    """
+
+    written = 0
+    with open(path, "w", encoding="utf-8") as corpus:
+        for puzzle in iter_puzzles(generator, count, seed=seed, workers=workers):
+            corpus.write(puzzle.to_json())
+            corpus.write("\n")
+            written += 1
+    return written
+
+
+def main(argv: Optional[Sequence[str]] = None, prog: Optional[str] = None) -> None:
+    parser = argparse.ArgumentParser(prog=prog, description="Generate a corpus of Robot Bouncer puzzles.")
+    parser.add_argument("output", help="Path of the JSON-lines corpus to write.")
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--width", type=int, default=16)
+    parser.add_argument("--height", type=int, default=16)
+    parser.add_argument("--depth", type=int, default=20, help="Optimal solution length in moves.")
+    parser.add_argument("--wall-density", type=float, default=0.25)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    generator = PuzzleGenerator(args.width, args.height, args.depth, wall_density=args.wall_density)
+    written = generate_corpus(args.output, generator, args.count, seed=args.seed, workers=args.workers)
+    print(f"Wrote {written} puzzles to {args.output}")
+    if written < args.count:
+        print(f"Skipped {args.count - written} seeds that could not reach depth {args.depth}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""External interfaces exposing Robot Bouncer to other processes."""
@@ -0,0 +1,280 @@
+"""Asyncio solve service speaking JSON lines over a local socket.
+
+Each request is one JSON object per line::
+
+    {"id": 1, "config": {"width": 7, "height": 5, "walls": [[3, 0]], "goals": [[6, 4]]}, "render": true}
+    {"op": "stats"}
+
+Solves run in an executor pool so the event loop never blocks, identical in-flight
+configurations share a single solve, and rendering only happens for requests that
+ask for it.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from robot_bouncer.app import GameConfig, RobotBouncerApp
+from robot_bouncer.core.engine import GameEngine
+from robot_bouncer.core.entities import Position
+from robot_bouncer.solver.base import GameSolver, SearchBudget, solve_within
+from robot_bouncer.solver.bfs import BfsSolver
+from robot_bouncer.visuals.base import GameRenderer
+from robot_bouncer.visuals.console import ConsoleRenderer
+
+SolverFactory = Callable[[GameEngine], GameSolver]
+
+
+def config_from_payload(payload: Dict[str, Any]) -> GameConfig:
+    """Build a :class:`GameConfig` from a JSON payload using ``[x, y]`` pairs for positions."""
+
+    def positions(key: str) -> Optional[List[Position]]:
+        values = payload.get(key)
+        if values is None:
+            return None
+        return [Position(int(x), int(y)) for x, y in values]
+
+    start = payload.get("robot_start", (0, 0))
+    return GameConfig(
+        width=int(payload.get("width", 5)),
+        height=int(payload.get("height", 5)),
+        walls=positions("walls"),
+        pads=positions("pads"),
+        goals=positions("goals"),
+        robot_start=Position(int(start[0]), int(start[1])),
+    )
+
+
+def config_key(config: GameConfig) -> Hashable:
+    """Return a canonical key so that equivalent configurations coalesce."""
+
+    def canonical(values: Optional[Sequence[Position]]) -> Tuple[Tuple[int, int], ...]:
+        return tuple(sorted({(position.x, position.y) for position in values or []}))
+
+    goals = tuple((goal.x, goal.y) for goal in dict.fromkeys(config.goals or []))
+    return (
+        config.width,
+        config.height,
+        canonical(config.walls),
+        canonical(config.pads),
+        goals,
+        (config.robot_start.x, config.robot_start.y),
+    )
+
+
+def _solve_config(config: GameConfig, solver_factory: SolverFactory, time_limit: Optional[float]) -> Dict[str, Any]:
+    app = RobotBouncerApp()
+    state = app.create_state(config)
+    solver = solver_factory(app.build_engine())
+    budget = SearchBudget(time_limit=time_limit) if time_limit is not None else None
+    result = solve_within(solver, state, budget)
+    return {
+        "success": result.success,
+        "explored": result.explored,
+        "exhausted": result.exhausted,
+        "lower_bound": result.lower_bound,
+        "path": [[position.x, position.y] for position in result.iter_positions()],
+        "commands": result.to_commands(),
+    }
+
+
+def _render_config(config: GameConfig, path: Sequence[Sequence[int]], renderer: GameRenderer) -> str:
+    app = RobotBouncerApp(renderer=renderer)
+    state = app.create_state(config)
+    if path:
+        state.robot.position = Position(*path[-1])
+    return renderer.render(state)
+
+
+class ServiceMetrics:
+    """Counters describing the load and latency of a :class:`SolveService`."""
+
+    def __init__(self, latency_window: int = 1024):
+        self.started = time.monotonic()
+        self.requests = 0
+        self.solves = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.queue_depth = 0
+        self._latencies: Deque[float] = deque(maxlen=latency_window)
+
+    def record_latency(self, seconds: float) -> None:
+        self._latencies.append(seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        uptime = max(time.monotonic() - self.started, 1e-9)
+        latencies = sorted(self._latencies)
+        return {
+            "requests": self.requests,
+            "solves": self.solves,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "queue_depth": self.queue_depth,
+            "uptime_s": uptime,
+            "throughput_rps": self.requests / uptime,
+            "latency_ms": {
+                label: self._percentile(latencies, fraction) * 1000.0
+                for label, fraction in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99))
+            },
+        }
+
+    @staticmethod
+    def _percentile(ordered: Sequence[float], fraction: float) -> float:
+        if not ordered:
+            return 0.0
+        index = min(len(ordered) - 1, int(fraction * len(ordered)))
+        return ordered[index]
+
+
+class SolveService:
+    """Run solves off the event loop and coalesce identical in-flight requests.
+
+    ``executor`` defaults to a thread pool. A :class:`ProcessPoolExecutor` can be
+    passed instead as long as ``solver_factory`` and ``renderer`` are picklable.
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        solver_factory: SolverFactory = BfsSolver,
+        renderer: Optional[GameRenderer] = None,
+        time_limit: Optional[float] = None,
+        latency_window: int = 1024,
+    ):
+        self.executor = executor or ThreadPoolExecutor()
+        self.solver_factory = solver_factory
+        self.renderer = renderer or ConsoleRenderer()
+        self.time_limit = time_limit
+        self.metrics = ServiceMetrics(latency_window)
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    async def solve(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Solve the configuration in ``payload["config"]`` and return a JSON-ready response."""
+
+        started = time.perf_counter()
+        self.metrics.requests += 1
+        config = config_from_payload(payload.get("config", {}))
+        key = config_key(config)
+
+        pending = self._in_flight.get(key)
+        if pending is None:
+            pending = self._submit(key, config)
+        else:
+            self.metrics.coalesced += 1
+        response = dict(await asyncio.shield(pending))
+
+        if payload.get("render"):
+            loop = asyncio.get_running_loop()
+            response["render"] = await loop.run_in_executor(
+                self.executor, _render_config, config, response["path"], self.renderer
+            )
+        if "id" in payload:
+            response["id"] = payload["id"]
+        self.metrics.record_latency(time.perf_counter() - started)
+        return response
+
+    def _submit(self, key: Hashable, config: GameConfig) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.executor, _solve_config, config, self.solver_factory, self.time_limit)
+        self._in_flight[key] = future
+        self.metrics.solves += 1
+        self.metrics.queue_depth += 1
+
+        def finished(_: asyncio.Future) -> None:
+            self._in_flight.pop(key, None)
+            self.metrics.queue_depth -= 1
+
+        future.add_done_callback(finished)
+        return future
+
+    async def handle_request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        op = payload.get("op", "solve")
+        if op == "stats":
+            return self.metrics.snapshot()
+        if op == "solve":
+            return await self.solve(payload)
+        raise ValueError(f"Unknown op: {op!r}")
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve JSON-line requests from one client, answering each as soon as it completes."""
+
+        write_lock = asyncio.Lock()
+        tasks = set()
+
+        async def answer(line: bytes) -> None:
+            payload: Any = None
+            try:
+                payload = json.loads(line)
+                response = await self.handle_request(payload)
+            except Exception as error:
+                self.metrics.errors += 1
+                response = {"error": str(error)}
+                if isinstance(payload, dict) and "id" in payload:
+                    response["id"] = payload["id"]
+            async with write_lock:
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                task = asyncio.create_task(answer(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    async def serve_tcp(self, host: str = "127.0.0.1", port: int = 8765) -> asyncio.Server:
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    async def serve_unix(self, path: str) -> asyncio.Server:
+        return await asyncio.start_unix_server(self.handle_connection, path)
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    executor: Executor
+    if args.processes:
+        executor = ProcessPoolExecutor(max_workers=args.workers)
+    else:
+        executor = ThreadPoolExecutor(max_workers=args.workers)
+    service = SolveService(executor=executor, time_limit=args.time_limit)
+    if args.unix:
+        server = await service.serve_unix(args.unix)
+    else:
+        server = await service.serve_tcp(args.host, args.port)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main(argv: Optional[Sequence[str]] = None, prog: Optional[str] = None) -> None:
+    parser = argparse.ArgumentParser(prog=prog, description="Serve Robot Bouncer solves over a local socket.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="Listen on a Unix socket at this path instead of TCP.")
+    parser.add_argument("--workers", type=int, default=None, help="Size of the executor pool.")
+    parser.add_argument("--processes", action="store_true", help="Use a process pool instead of threads.")
+    parser.add_argument("--time-limit", type=float, default=None, help="Per-solve time budget in seconds.")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Name-based registry of solvers and renderers, imported only when selected."""
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any, Dict, List
+
+
+class UnknownEntryError(LookupError):
+    """Raised when no solver or renderer is registered under the requested name."""
+
+
+SOLVERS: Dict[str, str] = {
+    "bfs": "robot_bouncer.solver.bfs:BfsSolver",
+    "jps": "robot_bouncer.solver.jps:JpsSolver",
+    "physics": "robot_bouncer.solver.physics:PhysicsSolver",
+    "tour": "robot_bouncer.solver.tour:TourSolver",
+    "anytime": "robot_bouncer.solver.anytime:AnytimeSolver",
+    "noop": "robot_bouncer.solver.base:NoOpSolver",
+}
+
+RENDERERS: Dict[str, str] = {
+    "console": "robot_bouncer.visuals.console:ConsoleRenderer",
+    "pyqt": "robot_bouncer.visuals.pyqt:PyQtRenderer",
+    "raster": "robot_bouncer.visuals.raster:RasterRenderer",
+}
+
+
+def _load(kind: str, table: Dict[str, str], name: str) -> Any:
+    target = table.get(name)
+    if target is None:
+        choices = ", ".join(sorted(table))
+        raise UnknownEntryError(f"Unknown {kind} {name!r}; choose one of: {choices}.")
+    module_name, _, attribute = target.partition(":")
+    return getattr(import_module(module_name), attribute)
+
+
+def load_solver(name: str) -> Any:
+    """Import and return the solver class registered under ``name``."""
+
+    return _load("solver", SOLVERS, name)
+
+
+def load_renderer(name: str) -> Any:
+    """Import and return the renderer class registered under ``name``."""
+
+    return _load("renderer", RENDERERS, name)
+
+
+def register_solver(name: str, target: str) -> None:
+    """Register a solver as a ``"module:attribute"`` path without importing it."""
+
+    SOLVERS[name] = target
+
+
+def register_renderer(name: str, target: str) -> None:
+    """Register a renderer as a ``"module:attribute"`` path without importing it."""
+
+    RENDERERS[name] = target
+
+
+def available_solvers() -> List[str]:
+    return sorted(SOLVERS)
+
+
+def available_renderers() -> List[str]:
+    return sorted(RENDERERS)
@@ -1,5 +1,49 @@
 """Solver implementations for Robot Bouncer."""
-from .base import GameSolver, SolverResult, NoOpSolver
-from .bfs import BfsSolver
+from __future__ import annotations
 
-__all__ = ["GameSolver", "SolverResult", "NoOpSolver", "BfsSolver"]
+from robot_bouncer._lazy import lazy_exports
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .anytime import AnytimeSolver
+    from .base import CancellationToken, GameSolver, NoOpSolver, SearchBudget, SolverResult, solve_within
+    from .bfs import BfsSolver
+    from .jps import JpsSolver
+    from .path import CompactPath
+    from .physics import PhysicsSolver, PhysicsSolverResult, TransitionTable
+    from .tour import TourSolver
+
+_EXPORTS = {
+    "AnytimeSolver": ".anytime",
+    "CancellationToken": ".base",
+    "CompactPath": ".path",
+    "GameSolver": ".base",
+    "SearchBudget": ".base",
+    "SolverResult": ".base",
+    "NoOpSolver": ".base",
+    "solve_within": ".base",
+    "BfsSolver": ".bfs",
+    "JpsSolver": ".jps",
+    "PhysicsSolver": ".physics",
+    "PhysicsSolverResult": ".physics",
+    "TransitionTable": ".physics",
+    "TourSolver": ".tour",
+}
+
+__all__ = [
+    "AnytimeSolver",
+    "CancellationToken",
+    "CompactPath",
+    "GameSolver",
+    "SearchBudget",
+    "SolverResult",
+    "NoOpSolver",
+    "solve_within",
+    "BfsSolver",
+    "JpsSolver",
+    "PhysicsSolver",
+    "PhysicsSolverResult",
+    "TransitionTable",
+    "TourSolver",
+]
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,135 @@
+"""Anytime solver that returns a quick path first and refines it while time allows."""
+from __future__ import annotations
+
+import heapq
+from itertools import count
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from robot_bouncer.core.engine import GameEngine, GameState
+from robot_bouncer.core.entities import Board, Direction, Position
+
+from .base import GameSolver, SearchBudget, SolverResult
+from .path import CompactPath
+
+
+class AnytimeSolver(GameSolver):
+    """Repeated weighted A* with a decreasing weight schedule.
+
+    The first pass uses a large weight and finds a suboptimal path after very few
+    expansions. Each following pass lowers the weight and prunes every node that
+    cannot beat the best path found so far. The final weight of ``1.0`` proves
+    optimality. When the budget runs out, the best path found so far is returned,
+    flagged as ``exhausted`` and paired with a lower bound on the optimal length.
+    If no path was found yet, the result leads to the frontier node closest to a
+    goal, as with :class:`BfsSolver`.
+    """
+
+    def __init__(
+        self,
+        engine: GameEngine,
+        allowed_directions: Optional[Iterable[Direction]] = None,
+        weights: Sequence[float] = (5.0, 3.0, 2.0, 1.5, 1.0),
+        on_improvement: Optional[Callable[[SolverResult], None]] = None,
+    ):
+        super().__init__(engine)
+        self.allowed_directions = list(allowed_directions or Direction)
+        self.weights = list(weights)
+        if not self.weights or self.weights[-1] != 1.0:
+            self.weights.append(1.0)
+        self.on_improvement = on_improvement
+
+    def solve(self, state: GameState, budget: Optional[SearchBudget] = None) -> SolverResult:
+        result = SolverResult(path=[state.robot.position], explored=0, success=False)
+        for result in self.iter_solutions(state, budget):
+            if self.on_improvement is not None:
+                self.on_improvement(result)
+        return result
+
+    def iter_solutions(self, state: GameState, budget: Optional[SearchBudget] = None) -> Iterator[SolverResult]:
+        """Yield successively shorter solutions until optimal or out of budget."""
+
+        start = state.robot.position
+        goals = state.goal_set
+        board = state.board
+        best: Optional[CompactPath] = None
+        explored = 0
+
+        for weight in self.weights:
+            bound = best.moves if best is not None else None
+            path, explored, lower_bound, exhausted = self._weighted_search(
+                board, start, goals, weight, bound, budget, explored
+            )
+            if exhausted:
+                if bound is not None:
+                    lower_bound = min(lower_bound, bound)
+                yield SolverResult(
+                    path=best if best is not None else path,
+                    explored=explored,
+                    success=best is not None,
+                    exhausted=True,
+                    lower_bound=lower_bound,
+                )
+                return
+            if path is None:
+                # Nothing beats the bound: the current best path is optimal.
+                if best is None:
+                    yield SolverResult(path=[start], explored=explored, success=False)
+                return
+            best = path
+            yield SolverResult(path=best, explored=explored, success=True)
+
+    def _weighted_search(
+        self,
+        board: Board,
+        start: Position,
+        goals: FrozenSet[Position],
+        weight: float,
+        bound: Optional[int],
+        budget: Optional[SearchBudget],
+        explored: int,
+    ) -> Tuple[Optional[CompactPath], int, int, bool]:
+        """Run one weighted A* pass.
+
+        Returns the path, the updated expansion count, a lower bound and whether the
+        budget ran out. On exhaustion the path leads to the frontier node closest to
+        a goal instead of to a goal.
+        """
+
+        tie_breaker = count()
+        start_estimate = self._distance_to_goals(start, goals)
+        if bound is not None and start_estimate >= bound:
+            return None, explored, bound, False
+        open_list: List[Tuple[float, int, int, Position]] = [
+            (weight * start_estimate, next(tie_breaker), 0, start)
+        ]
+        costs: Dict[Position, int] = {start: 0}
+        parents: Dict[Position, Optional[Position]] = {start: None}
+
+        while open_list:
+            if budget is not None and budget.exhausted(explored):
+                frontier = (position for _, _, _, position in open_list)
+                partial = self._frontier_result(frontier, costs, parents, goals, explored)
+                return partial.compact, explored, partial.lower_bound, True
+            _, _, cost, current = heapq.heappop(open_list)
+            if cost > costs[current]:
+                continue
+            explored += 1
+            if current in goals:
+                return CompactPath.from_parents(current, parents), explored, cost, False
+
+            for direction in self.allowed_directions:
+                next_position = current.move(direction)
+                if not board.in_bounds(next_position) or board.is_wall(next_position):
+                    continue
+                next_cost = cost + 1
+                if next_cost >= costs.get(next_position, next_cost + 1):
+                    continue
+                estimate = self._distance_to_goals(next_position, goals)
+                if bound is not None and next_cost + estimate >= bound:
+                    continue
+                costs[next_position] = next_cost
+                parents[next_position] = current
+                priority = next_cost + weight * estimate
+                heapq.heappush(open_list, (priority, next(tie_breaker), next_cost, next_position))
+
+        return None, explored, bound or 0, False
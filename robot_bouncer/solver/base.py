@@ -1,48 +1,184 @@
 """Solver interfaces for Robot Bouncer."""
 from __future__ import annotations
 
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Iterable, List, Optional
+from typing import AbstractSet, Any, Dict, Iterable, Iterator, List, Mapping, Optional, Union
 
 from robot_bouncer.core.engine import GameEngine, GameState
 from robot_bouncer.core.entities import Direction, Position
 
+from .path import CompactPath
+
+
+class CancellationToken:
+    """Thread-safe flag used to abort a running solve from the outside."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+class SearchBudget:
+    """Limits applied to a single :meth:`GameSolver.solve` call.
+
+    The node limit is compared on every call to :meth:`exhausted`; the clock and the
+    cancellation token are only consulted every ``check_interval`` nodes so that the
+    check stays cheap inside tight search loops.
+    """
+
+    def __init__(
+        self,
+        time_limit: Optional[float] = None,
+        max_nodes: Optional[int] = None,
+        token: Optional[CancellationToken] = None,
+        check_interval: int = 256,
+    ):
+        self.deadline = None if time_limit is None else time.monotonic() + time_limit
+        self.max_nodes = max_nodes
+        self.token = token
+        self.check_interval = max(1, check_interval)
+
+    def exhausted(self, nodes: int) -> bool:
+        if self.max_nodes is not None and nodes >= self.max_nodes:
+            return True
+        if nodes % self.check_interval:
+            return False
+        if self.token is not None and self.token.cancelled:
+            return True
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
 
 class SolverResult:
-    """Container for solver outputs."""
+    """Container for solver outputs.
+
+    The path may be given as a list of positions or as a :class:`CompactPath`. In the
+    latter case ``path`` is only materialized when accessed, and the ``iter_*``
+    helpers stream positions and commands without building the full list. Once
+    materialized, the list is the only copy kept, so changes made to it are seen
+    by every other accessor.
+
+    When the search budget runs out, ``exhausted`` is set, ``path`` leads to the
+    frontier node closest to a goal and ``lower_bound`` holds a lower bound on the
+    number of moves still separating the start from the nearest goal. Solvers that
+    search backwards from the goals, such as :class:`PhysicsSolver`, have no such
+    frontier and return the start tile alone.
+    """
 
-    def __init__(self, path: Iterable[Position], explored: int = 0, success: bool = False):
-        self.path = list(path)
+    def __init__(
+        self,
+        path: Union[Iterable[Position], CompactPath],
+        explored: int = 0,
+        success: bool = False,
+        exhausted: bool = False,
+        lower_bound: Optional[int] = None,
+    ):
+        self.compact: Optional[CompactPath] = None
+        self._path: Optional[List[Position]] = None
+        if isinstance(path, CompactPath):
+            self.compact = path
+        else:
+            self._path = list(path)
         self.explored = explored
         self.success = success
+        self.exhausted = exhausted
+        self.lower_bound = lower_bound
 
     def __repr__(self) -> str:
-        return f"SolverResult(success={self.success}, steps={len(self.path)}, explored={self.explored})"
+        steps = len(self._path) if self._path is not None else self.compact.moves + 1
+        return f"SolverResult(success={self.success}, steps={steps}, explored={self.explored})"
 
-    def to_commands(self) -> List[str]:
-        """Translate the path into human-readable movement commands."""
+    @property
+    def path(self) -> List[Position]:
+        if self._path is None:
+            self._path = list(self.compact.iter_positions())
+            self.compact = None
+        return self._path
+
+    @path.setter
+    def path(self, positions: Iterable[Position]) -> None:
+        self._path = list(positions)
+        self.compact = None
+
+    @property
+    def moves(self) -> int:
+        if self._path is None:
+            return self.compact.moves
+        return max(len(self._path) - 1, 0)
+
+    @property
+    def final_position(self) -> Optional[Position]:
+        if self._path is None:
+            return self.compact.end
+        return self._path[-1] if self._path else None
+
+    def to_compact(self) -> Optional[CompactPath]:
+        """Return the run-length encoded path.
+
+        A materialized ``path`` is encoded afresh on every call, since it may have
+        changed since the last one. ``None`` is returned for an empty path, which
+        has no start tile to encode.
+        """
 
-        commands: List[str] = []
-        if len(self.path) < 2:
-            return commands
+        if self._path is None:
+            return self.compact
+        return CompactPath.from_positions(self._path) if self._path else None
 
-        previous = self.path[0]
-        for current in self.path[1:]:
-            dx = current.x - previous.x
-            dy = current.y - previous.y
-            direction = self._direction_from_delta(dx, dy)
-            commands.append(self._format_command(direction, current))
+    def iter_positions(self) -> Iterator[Position]:
+        if self._path is not None:
+            return iter(self._path)
+        return self.compact.iter_positions()
+
+    def iter_commands(self) -> Iterator[str]:
+        """Lazily yield one human-readable command per tile move."""
+
+        if self._path is None:
+            for direction, destination in self.compact.iter_moves():
+                yield self._format_command(direction, destination)
+            return
+
+        positions = iter(self._path)
+        previous = next(positions, None)
+        for current in positions:
+            direction = self._direction_from_delta(current.x - previous.x, current.y - previous.y)
+            yield self._format_command(direction, current)
             previous = current
-        return commands
+
+    def iter_run_commands(self) -> Iterator[str]:
+        """Lazily yield one command per straight run, such as ``Move East x37 to (40, 2)``."""
+
+        compact = self.to_compact()
+        if compact is None:
+            return
+        for direction, count, destination in compact.iter_runs():
+            name = direction.name.capitalize()
+            yield f"Move {name} x{count} to ({destination.x}, {destination.y})"
+
+    def to_commands(self) -> List[str]:
+        """Translate the path into human-readable movement commands."""
+
+        return list(self.iter_commands())
 
     def to_computation_details(self) -> List[str]:
         """Return user-facing details about the solver computation."""
 
-        return [
+        details = [
             f"Solved: {'yes' if self.success else 'no'}",
             f"States explored: {self.explored}",
-            f"Path length: {max(len(self.path) - 1, 0)} moves",
+            f"Path length: {self.moves} moves",
         ]
+        if self.exhausted:
+            details.append("Budget exhausted: yes")
+        if self.lower_bound is not None:
+            details.append(f"Distance lower bound: {self.lower_bound} moves")
+        return details
 
     @staticmethod
     def _direction_from_delta(dx: int, dy: int) -> Direction:
@@ -69,17 +205,60 @@ class GameSolver(ABC):
         self.engine = engine
 
     @abstractmethod
-    def solve(self, state: GameState) -> SolverResult:
-        """Attempt to solve the game and return a result."""
+    def solve(self, state: GameState, budget: Optional[SearchBudget] = None) -> SolverResult:
+        """Attempt to solve the game within ``budget`` and return a result."""
 
     def apply_solution(self, state: GameState, result: SolverResult) -> GameState:
-        for position in result.path:
-            state.robot.position = position
+        final_position = result.final_position
+        if final_position is not None:
+            state.robot.position = final_position
         return state
 
+    @staticmethod
+    def _distance_to_goals(position: Position, goals: AbstractSet[Position]) -> int:
+        """Manhattan distance to the nearest goal, a lower bound on the remaining moves."""
+
+        if not goals:
+            return 0
+        return min(abs(position.x - goal.x) + abs(position.y - goal.y) for goal in goals)
+
+    def _frontier_result(
+        self,
+        frontier: Iterable[Position],
+        costs: Mapping[Position, int],
+        parents: Dict[Position, Optional[Position]],
+        goals: AbstractSet[Position],
+        explored: int,
+    ) -> SolverResult:
+        """Build the result of a forward search whose budget ran out.
+
+        The path leads to the frontier node closest to a goal. Every undiscovered
+        path to a goal leaves the explored region through the frontier, so the
+        smallest ``cost + distance`` over the frontier is a lower bound.
+        """
+
+        remaining = {position: self._distance_to_goals(position, goals) for position in frontier}
+        closest = min(remaining, key=lambda position: (remaining[position], costs[position]))
+        return SolverResult(
+            path=CompactPath.from_parents(closest, parents),
+            explored=explored,
+            success=False,
+            exhausted=True,
+            lower_bound=min(costs[position] + distance for position, distance in remaining.items()),
+        )
+
+
+def solve_within(solver: Any, state: GameState, budget: Optional[SearchBudget] = None) -> SolverResult:
+    """Call ``solver.solve``, passing ``budget`` only when one is given.
+
+    Solvers written before budgets existed only accept the state.
+    """
+
+    return solver.solve(state) if budget is None else solver.solve(state, budget)
+
 
 class NoOpSolver(GameSolver):
     """Fallback solver that does nothing."""
 
-    def solve(self, state: GameState) -> SolverResult:
+    def solve(self, state: GameState, budget: Optional[SearchBudget] = None) -> SolverResult:
         return SolverResult(path=[state.robot.position], explored=0, success=state.is_goal_reached())
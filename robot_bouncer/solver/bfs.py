@@ -2,12 +2,13 @@
 from __future__ import annotations
 
 from collections import deque
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, Optional
 
 from robot_bouncer.core.engine import GameEngine, GameState
 from robot_bouncer.core.entities import Direction, Position
 
-from .base import GameSolver, SolverResult
+from .base import GameSolver, SearchBudget, SolverResult
+from .path import CompactPath
 
 
 class BfsSolver(GameSolver):
@@ -17,19 +18,22 @@ class BfsSolver(GameSolver):
         super().__init__(engine)
         self.allowed_directions = list(allowed_directions or Direction)
 
-    def solve(self, state: GameState) -> SolverResult:
+    def solve(self, state: GameState, budget: Optional[SearchBudget] = None) -> SolverResult:
         start = state.robot.position
-        goals = set(state.goals)
+        goals = state.goal_set
         queue = deque([start])
         parents: Dict[Position, Optional[Position]] = {start: None}
+        depths: Dict[Position, int] = {start: 0}
         explored = 0
 
         board = state.board
         while queue:
+            if budget is not None and budget.exhausted(explored):
+                return self._frontier_result(queue, depths, parents, goals, explored)
             current = queue.popleft()
             explored += 1
             if current in goals:
-                path = self._reconstruct_path(current, parents)
+                path = CompactPath.from_parents(current, parents)
                 return SolverResult(path=path, explored=explored, success=True)
 
             for direction in self.allowed_directions:
@@ -39,16 +43,7 @@ class BfsSolver(GameSolver):
                 if next_position in parents:
                     continue
                 parents[next_position] = current
+                depths[next_position] = depths[current] + 1
                 queue.append(next_position)
 
         return SolverResult(path=[start], explored=explored, success=False)
-
-    @staticmethod
-    def _reconstruct_path(goal: Position, parents: Dict[Position, Optional[Position]]) -> List[Position]:
-        path: List[Position] = []
-        current: Optional[Position] = goal
-        while current is not None:
-            path.append(current)
-            current = parents[current]
-        path.reverse()
-        return path
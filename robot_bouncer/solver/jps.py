@@ -0,0 +1,205 @@
+"""Jump Point Search solver for Robot Bouncer."""
+from __future__ import annotations
+
+import heapq
+from itertools import count
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from robot_bouncer.core.engine import GameState
+from robot_bouncer.core.entities import Board, Direction, Position
+
+from .base import GameSolver, SearchBudget, SolverResult
+from .path import CompactPath
+
+_HORIZONTAL = (Direction.EAST, Direction.WEST)
+_VERTICAL = (Direction.NORTH, Direction.SOUTH)
+
+
+class _BudgetExhausted(Exception):
+    """Raised from inside a jump scan when the search budget runs out."""
+
+
+class _JumpGrid:
+    """Walkability grid with jump results memoized per solve.
+
+    Tiles are stored row by row with a one-tile wall border, so every neighbour of a
+    board tile is a valid index and moves are plain integer offsets. A jump from a
+    tile in a given direction only depends on the board and the goals, so every tile
+    crossed by a scan records the jump point the scan ended on and later scans stop
+    as soon as they reach a recorded tile. The scanning work of a whole solve is
+    therefore bounded by four visits per tile.
+
+    Scanned tiles count toward the search budget together with the expanded jump
+    points, and the budget is checked on every scanned tile.
+    """
+
+    def __init__(self, board: Board, goals: FrozenSet[Position], budget: Optional[SearchBudget] = None):
+        self.stride = board.width + 2
+        size = self.stride * (board.height + 2)
+        self.open = bytearray(size)
+        row = bytearray(b"\x00") + bytearray(b"\x01") * board.width + bytearray(b"\x00")
+        for y in range(board.height):
+            start = (y + 1) * self.stride
+            self.open[start : start + self.stride] = row
+        for wall in board.walls:
+            if board.in_bounds(wall):
+                self.open[self.index(wall)] = 0
+        self.goals = bytearray(size)
+        for goal in goals:
+            if board.in_bounds(goal):
+                self.goals[self.index(goal)] = 1
+        self.offsets = {direction: direction.delta[0] + direction.delta[1] * self.stride for direction in Direction}
+        self.horizontal = (self.offsets[Direction.EAST], self.offsets[Direction.WEST])
+        self.vertical = (self.offsets[Direction.NORTH], self.offsets[Direction.SOUTH])
+        self.jumps: Dict[int, List[int]] = {offset: [-2] * size for offset in self.offsets.values()}
+        self.budget = budget
+        self.expanded = 0
+        self.scanned = 0
+
+    @property
+    def nodes(self) -> int:
+        return self.expanded + self.scanned
+
+    def index(self, position: Position) -> int:
+        return (position.y + 1) * self.stride + position.x + 1
+
+    def position(self, index: int) -> Position:
+        y, x = divmod(index, self.stride)
+        return Position(x - 1, y - 1)
+
+    def forced(self, index: int, step: int, sides: Tuple[int, int]) -> List[int]:
+        """Side offsets that are open at ``index`` but blocked next to the tile behind it."""
+
+        open_tiles = self.open
+        behind = index - step
+        return [side for side in sides if open_tiles[index + side] and not open_tiles[behind + side]]
+
+    def jump(self, index: int, step: int) -> int:
+        """Return the index of the jump point reached from ``index`` along ``step``, or -1."""
+
+        memo = self.jumps[step]
+        open_tiles = self.open
+        goals = self.goals
+        horizontal = step in self.horizontal
+        left, right = self.vertical if horizontal else self.horizontal
+        crossed: List[int] = []
+        while True:
+            result = memo[index]
+            if result != -2:
+                break
+            crossed.append(index)
+            self.scanned += 1
+            if self.budget is not None and self.budget.exhausted(self.expanded + self.scanned):
+                raise _BudgetExhausted
+            index += step
+            if not open_tiles[index]:
+                result = -1
+                break
+            if goals[index]:
+                result = index
+                break
+            behind = index - step
+            if (open_tiles[index + left] and not open_tiles[behind + left]) or (
+                open_tiles[index + right] and not open_tiles[behind + right]
+            ):
+                result = index
+                break
+            if not horizontal and (self.jump(index, left) != -1 or self.jump(index, right) != -1):
+                result = index
+                break
+        for tile in crossed:
+            memo[tile] = result
+        return result
+
+
+class JpsSolver(GameSolver):
+    """Jump Point Search on the 4-connected step model used by :class:`BfsSolver`.
+
+    Paths are canonically ordered so that vertical moves come first and horizontal
+    moves branch off them. Horizontal jumps only stop on goals or forced vertical
+    neighbours, while vertical jumps also stop wherever a horizontal jump would
+    succeed. Only jump points are pushed to the open list, which keeps the number of
+    expansions small on open boards with sparse walls, and jump scans are memoized
+    so that no tile is scanned twice in the same direction. Scanned tiles count as
+    nodes toward a :class:`SearchBudget`.
+    """
+
+    def solve(self, state: GameState, budget: Optional[SearchBudget] = None) -> SolverResult:
+        start = state.robot.position
+        goals = state.goal_set
+        if start in goals:
+            return SolverResult(path=[start], explored=1, success=True)
+
+        grid = _JumpGrid(state.board, goals, budget)
+        tie_breaker = count()
+        open_list: List[Tuple[int, int, Position, Optional[Direction]]] = [
+            (self._heuristic(start, goals), next(tie_breaker), start, None)
+        ]
+        costs: Dict[Position, int] = {start: 0}
+        parents: Dict[Position, Optional[Position]] = {start: None}
+        closed: Set[Position] = set()
+        explored = 0
+
+        while open_list:
+            entry = heapq.heappop(open_list)
+            _, _, current, arrival = entry
+            if current in closed:
+                continue
+            if budget is not None and budget.exhausted(grid.nodes):
+                heapq.heappush(open_list, entry)
+                return self._frontier_result(self._open_positions(open_list, closed), costs, parents, goals, explored)
+            closed.add(current)
+            explored += 1
+            grid.expanded = explored
+            if current in goals:
+                path = CompactPath.from_parents(current, parents)
+                return SolverResult(path=path, explored=explored, success=True)
+
+            origin = grid.index(current)
+            try:
+                jumps = [
+                    (direction, grid.jump(origin, grid.offsets[direction]))
+                    for direction in self._successor_directions(grid, origin, arrival)
+                ]
+            except _BudgetExhausted:
+                closed.discard(current)
+                heapq.heappush(open_list, entry)
+                return self._frontier_result(self._open_positions(open_list, closed), costs, parents, goals, explored)
+            for direction, target in jumps:
+                if target == -1:
+                    continue
+                jump_point = grid.position(target)
+                if jump_point in closed:
+                    continue
+                cost = costs[current] + self._distance(current, jump_point)
+                if cost >= costs.get(jump_point, cost + 1):
+                    continue
+                costs[jump_point] = cost
+                parents[jump_point] = current
+                priority = cost + self._heuristic(jump_point, goals)
+                heapq.heappush(open_list, (priority, next(tie_breaker), jump_point, direction))
+
+        return SolverResult(path=[start], explored=explored, success=False)
+
+    @staticmethod
+    def _open_positions(
+        open_list: List[Tuple[int, int, Position, Optional[Direction]]], closed: Set[Position]
+    ) -> Set[Position]:
+        return {position for _, _, position, _ in open_list if position not in closed}
+
+    @staticmethod
+    def _successor_directions(grid: _JumpGrid, index: int, arrival: Optional[Direction]) -> Iterable[Direction]:
+        if arrival is None:
+            return list(Direction)
+        if arrival in _VERTICAL:
+            return [arrival, *_HORIZONTAL]
+        forced = grid.forced(index, grid.offsets[arrival], grid.vertical)
+        return [arrival, *(direction for direction in _VERTICAL if grid.offsets[direction] in forced)]
+
+    @staticmethod
+    def _distance(origin: Position, target: Position) -> int:
+        return abs(origin.x - target.x) + abs(origin.y - target.y)
+
+    @classmethod
+    def _heuristic(cls, position: Position, goals: FrozenSet[Position]) -> int:
+        return min(cls._distance(position, goal) for goal in goals) if goals else 0
@@ -0,0 +1,148 @@
+"""Compact, run-length encoded representation of solver paths."""
+from __future__ import annotations
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from robot_bouncer.core.entities import Direction, Position
+
+_DIRECTIONS: List[Direction] = list(Direction)
+_DIRECTION_CODES = {direction: code for code, direction in enumerate(_DIRECTIONS)}
+
+Run = Tuple[Direction, int]
+
+
+def _straight_run(origin: Position, target: Position) -> Optional[Run]:
+    dx = target.x - origin.x
+    dy = target.y - origin.y
+    if dx and dy:
+        raise ValueError("Compact paths can only be extended along a row or a column.")
+    if dx:
+        return (Direction.EAST if dx > 0 else Direction.WEST, abs(dx))
+    if dy:
+        return (Direction.SOUTH if dy > 0 else Direction.NORTH, abs(dy))
+    return None
+
+
+class CompactPath:
+    """A path of unit moves stored as its start tile and ``(direction, count)`` runs.
+
+    A straight corridor of any length costs a single run, and :meth:`pack` offers a
+    fixed-size alternative storing every move as a 2-bit direction code.
+    """
+
+    def __init__(self, start: Position, runs: Iterable[Run] = ()):
+        self.start = start
+        self.end = start
+        self.moves = 0
+        self.runs: List[Run] = []
+        for direction, count in runs:
+            self.append(direction, count)
+
+    def __repr__(self) -> str:
+        return f"CompactPath(start={self.start}, moves={self.moves}, runs={len(self.runs)})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactPath):
+            return NotImplemented
+        return self.start == other.start and self.runs == other.runs
+
+    def append(self, direction: Direction, count: int = 1) -> None:
+        if count <= 0:
+            return
+        if self.runs and self.runs[-1][0] is direction:
+            self.runs[-1] = (direction, self.runs[-1][1] + count)
+        else:
+            self.runs.append((direction, count))
+        dx, dy = direction.delta
+        self.end = Position(self.end.x + dx * count, self.end.y + dy * count)
+        self.moves += count
+
+    def extend_to(self, target: Position) -> None:
+        """Append the straight run from the current end to ``target``."""
+
+        run = _straight_run(self.end, target)
+        if run is not None:
+            self.append(*run)
+
+    @classmethod
+    def from_positions(cls, positions: Iterable[Position]) -> "CompactPath":
+        iterator = iter(positions)
+        start = next(iterator, None)
+        if start is None:
+            raise ValueError("A compact path needs at least a start position.")
+        path = cls(start)
+        for position in iterator:
+            if abs(position.x - path.end.x) + abs(position.y - path.end.y) != 1:
+                raise ValueError("Consecutive positions in a compact path must be adjacent tiles.")
+            path.extend_to(position)
+        return path
+
+    @classmethod
+    def from_parents(cls, goal: Position, parents: Dict[Position, Optional[Position]]) -> "CompactPath":
+        """Build the path ending at ``goal`` from a search tree of parent pointers."""
+
+        reversed_runs: List[Run] = []
+        current = goal
+        previous = parents[current]
+        while previous is not None:
+            run = _straight_run(previous, current)
+            if run is None:
+                raise ValueError("Parent pointers must link distinct tiles.")
+            direction, count = run
+            if reversed_runs and reversed_runs[-1][0] is direction:
+                reversed_runs[-1] = (direction, reversed_runs[-1][1] + count)
+            else:
+                reversed_runs.append((direction, count))
+            current, previous = previous, parents[previous]
+        return cls(current, reversed(reversed_runs))
+
+    def iter_positions(self) -> Iterator[Position]:
+        x, y = self.start.x, self.start.y
+        yield self.start
+        for direction, count in self.runs:
+            dx, dy = direction.delta
+            for _ in range(count):
+                x += dx
+                y += dy
+                yield Position(x, y)
+
+    def iter_moves(self) -> Iterator[Tuple[Direction, Position]]:
+        """Yield every unit move as its direction and destination tile."""
+
+        x, y = self.start.x, self.start.y
+        for direction, count in self.runs:
+            dx, dy = direction.delta
+            for _ in range(count):
+                x += dx
+                y += dy
+                yield direction, Position(x, y)
+
+    def iter_runs(self) -> Iterator[Tuple[Direction, int, Position]]:
+        """Yield every run as its direction, length and destination tile."""
+
+        x, y = self.start.x, self.start.y
+        for direction, count in self.runs:
+            dx, dy = direction.delta
+            x += dx * count
+            y += dy * count
+            yield direction, count, Position(x, y)
+
+    def pack(self) -> bytes:
+        """Encode the moves as 2-bit direction codes, four moves per byte."""
+
+        packed = bytearray((self.moves + 3) // 4)
+        index = 0
+        for direction, count in self.runs:
+            code = _DIRECTION_CODES[direction]
+            for _ in range(count):
+                packed[index >> 2] |= code << ((index & 3) * 2)
+                index += 1
+        return bytes(packed)
+
+    @classmethod
+    def unpack(cls, start: Position, data: bytes, moves: int) -> "CompactPath":
+        path = cls(start)
+        for index in range(moves):
+            code = data[index >> 2] >> ((index & 3) * 2) & 0b11
+            path.append(_DIRECTIONS[code])
+        return path
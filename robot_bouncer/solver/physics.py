@@ -0,0 +1,212 @@
+"""Physics-consistent solver driven by the engine's rule pipeline."""
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
+
+from robot_bouncer.core.engine import GameEngine, GameState
+from robot_bouncer.core.entities import Board, Direction, Position, Robot
+
+from .base import GameSolver, SearchBudget, SolverResult
+from .path import CompactPath
+
+MotionState = Tuple[Position, Direction]
+
+
+class TransitionTable:
+    """Memoized ``(position, direction)`` transitions for a single board and goal set.
+
+    Each state is pushed through :meth:`GameEngine.step` at most once; later lookups
+    are served from the table.
+    """
+
+    def __init__(self, engine: GameEngine, board: Board, goals: Iterable[Position]):
+        self.engine = engine
+        self.board = Board(
+            width=board.width,
+            height=board.height,
+            walls=list(board.walls),
+            bounce_pads=list(board.bounce_pads),
+        )
+        self.goals = list(goals)
+        self._transitions: Dict[MotionState, MotionState] = {}
+        self._scratch = GameState(
+            board=self.board,
+            robot=Robot(position=Position(0, 0), direction=Direction.EAST),
+            goals=self.goals,
+        )
+
+    def __len__(self) -> int:
+        return len(self._transitions)
+
+    def next_state(self, state: MotionState) -> MotionState:
+        cached = self._transitions.get(state)
+        if cached is not None:
+            return cached
+        robot = self._scratch.robot
+        robot.position, robot.direction = state
+        self.engine.step(self._scratch)
+        result = (robot.position, robot.direction)
+        self._transitions[state] = result
+        return result
+
+    def states(self) -> Iterable[MotionState]:
+        for position in self.board.iter_tiles():
+            if self.board.is_wall(position):
+                continue
+            for direction in Direction:
+                yield (position, direction)
+
+
+class PhysicsSolverResult(SolverResult):
+    """Solver result carrying the launch direction and engine step count of the plan."""
+
+    def __init__(
+        self,
+        path: Union[Iterable[Position], CompactPath],
+        explored: int = 0,
+        success: bool = False,
+        launch_direction: Optional[Direction] = None,
+        steps: int = 0,
+        dead_states: Optional[Set[MotionState]] = None,
+        exhausted: bool = False,
+        lower_bound: Optional[int] = None,
+    ):
+        super().__init__(
+            path=path,
+            explored=explored,
+            success=success,
+            exhausted=exhausted,
+            lower_bound=lower_bound,
+        )
+        self.launch_direction = launch_direction
+        self.steps = steps
+        self.dead_states = dead_states or set()
+
+    def to_computation_details(self) -> List[str]:
+        details = super().to_computation_details()
+        if self.launch_direction is not None:
+            details.append(f"Launch direction: {self.launch_direction.name.capitalize()}")
+        details.append(f"Engine steps: {self.steps}")
+        details.append(f"Dead states: {len(self.dead_states)}")
+        return details
+
+
+class PhysicsSolver(GameSolver):
+    """Solver whose moves are exactly the ones produced by the engine's rules.
+
+    The robot is not steered tile by tile: it is launched in one of the allowed
+    directions and then evolves through :meth:`GameEngine.step`, bouncing off walls
+    and pads. Every ``(position, direction)`` state is evaluated once, the resulting
+    transition graph is searched backwards from the goals, and the quickest launch
+    is returned. States from which no goal can ever be reached are reported as
+    ``dead_states`` on the result.
+
+    Since the search runs backwards from the goals, there is no frontier to walk
+    towards when the budget runs out: the exhausted result holds the start tile
+    alone, with the distance to the nearest goal as its lower bound.
+    """
+
+    def __init__(self, engine: GameEngine, allowed_directions: Optional[Iterable[Direction]] = None):
+        super().__init__(engine)
+        self.allowed_directions = list(allowed_directions or Direction)
+        self._tables: Dict[Tuple, TransitionTable] = {}
+
+    def transition_table(self, state: GameState) -> TransitionTable:
+        board = state.board
+        key = (
+            board.width,
+            board.height,
+            frozenset(board.walls),
+            frozenset(board.bounce_pads),
+            state.goal_set,
+        )
+        table = self._tables.get(key)
+        if table is None:
+            table = TransitionTable(self.engine, board, state.goals)
+            self._tables[key] = table
+        return table
+
+    def solve(self, state: GameState, budget: Optional[SearchBudget] = None) -> PhysicsSolverResult:
+        start = state.robot.position
+        table = self.transition_table(state)
+        distances = self._distances_to_goal(table, state.goal_set, budget)
+        if distances is None:
+            return PhysicsSolverResult(
+                path=[start],
+                explored=len(table),
+                success=False,
+                exhausted=True,
+                lower_bound=self._distance_to_goals(start, state.goal_set),
+            )
+        dead_states = {motion for motion in table.states() if motion not in distances}
+
+        launches = sorted(self.allowed_directions, key=lambda direction: direction != state.robot.direction)
+        best: Optional[Tuple[int, Direction]] = None
+        for direction in launches:
+            steps = distances.get((start, direction))
+            if steps is not None and (best is None or steps < best[0]):
+                best = (steps, direction)
+
+        if best is None:
+            return PhysicsSolverResult(
+                path=[start],
+                explored=len(table),
+                success=False,
+                dead_states=dead_states,
+            )
+
+        steps, direction = best
+        return PhysicsSolverResult(
+            path=self._trace(table, (start, direction), steps),
+            explored=len(table),
+            success=True,
+            launch_direction=direction,
+            steps=steps,
+            dead_states=dead_states,
+        )
+
+    def apply_solution(self, state: GameState, result: SolverResult) -> GameState:
+        if not isinstance(result, PhysicsSolverResult) or result.launch_direction is None:
+            return super().apply_solution(state, result)
+        state.robot.direction = result.launch_direction
+        for _ in range(result.steps):
+            self.engine.step(state)
+        if result.success and not state.is_goal_reached():
+            raise RuntimeError("Replaying the plan through the engine did not reach a goal.")
+        return state
+
+    @staticmethod
+    def _distances_to_goal(
+        table: TransitionTable,
+        goals: FrozenSet[Position],
+        budget: Optional[SearchBudget] = None,
+    ) -> Optional[Dict[MotionState, int]]:
+        predecessors: Dict[MotionState, List[MotionState]] = {}
+        distances: Dict[MotionState, int] = {}
+        queue: deque[MotionState] = deque()
+        for visited, motion in enumerate(table.states()):
+            if budget is not None and budget.exhausted(visited):
+                return None
+            if motion[0] in goals:
+                distances[motion] = 0
+                queue.append(motion)
+                continue
+            predecessors.setdefault(table.next_state(motion), []).append(motion)
+
+        while queue:
+            current = queue.popleft()
+            for previous in predecessors.get(current, ()):
+                if previous in distances:
+                    continue
+                distances[previous] = distances[current] + 1
+                queue.append(previous)
+        return distances
+
+    @staticmethod
+    def _trace(table: TransitionTable, motion: MotionState, steps: int) -> CompactPath:
+        path = CompactPath(motion[0])
+        for _ in range(steps):
+            motion = table.next_state(motion)
+            path.extend_to(motion[0])
+        return path
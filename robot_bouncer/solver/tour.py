@@ -0,0 +1,308 @@
+"""Multi-goal tour solver for Robot Bouncer."""
+from __future__ import annotations
+
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from robot_bouncer.core.engine import GameEngine, GameState
+from robot_bouncer.core.entities import Board, Direction, Position
+
+from .base import GameSolver, SearchBudget, SolverResult
+from .path import CompactPath
+
+_UNREACHABLE = float("inf")
+_FALLBACK_LIMIT = 12
+
+
+class _GoalTree:
+    """Shortest-path tree rooted at a goal, pointing every tile one step closer to it."""
+
+    def __init__(self, goal: Position, toward: Dict[Position, Optional[Position]], distances: Dict[Position, int]):
+        self.goal = goal
+        self.toward = toward
+        self.distances = distances
+
+    def walk_from(self, origin: Position) -> Iterator[Position]:
+        current = self.toward[origin]
+        while current is not None:
+            yield current
+            current = self.toward[current]
+
+
+class TourSolver(GameSolver):
+    """Visit every goal of the state using a precomputed distance matrix.
+
+    A forward BFS from the start finds the first leg to every goal, and one BFS is
+    run backwards from each goal, which yields the distances from every other goal.
+    The visiting order is solved exactly with bitmask dynamic programming up to
+    ``exact_limit`` goals and with a nearest-neighbour tour refined by 2-opt and
+    or-opt above that. Restricted directions make the distances asymmetric, so both
+    refinements price every leg in the direction it is travelled. Should the
+    heuristic leave a goal unreachable on a small instance, the exact ordering is
+    tried before giving up. The legs are then stitched into a single path.
+
+    If the budget runs out before the start reaches every goal, the result leads to
+    the frontier node closest to an unreached goal, as with :class:`BfsSolver`. If it
+    runs out while the goal distances are computed, the result walks to the nearest
+    goal and on through the goals already measured. Both are unsuccessful and
+    flagged as ``exhausted``. If the budget runs out during the exact ordering, the
+    heuristic order is used instead.
+    """
+
+    def __init__(
+        self,
+        engine: GameEngine,
+        allowed_directions: Optional[Iterable[Direction]] = None,
+        exact_limit: int = 16,
+    ):
+        super().__init__(engine)
+        self.allowed_directions = list(allowed_directions or Direction)
+        self.exact_limit = exact_limit
+
+    def solve(self, state: GameState, budget: Optional[SearchBudget] = None) -> SolverResult:
+        start = state.robot.position
+        targets = [goal for goal in dict.fromkeys(state.goals) if goal != start]
+        if not targets:
+            return SolverResult(path=[start], explored=0, success=start in state.goal_set)
+
+        parents, depths, frontier = self._explore_from(state.board, start, targets, budget)
+        explored = len(depths)
+        if frontier:
+            unreached = frozenset(target for target in targets if target not in depths)
+            result = self._frontier_result(frontier, depths, parents, unreached, explored)
+            # The tour has to reach every target, so the known target depths are lower bounds too.
+            result.lower_bound = max([result.lower_bound, *(depths[target] for target in targets if target in depths)])
+            return result
+        from_start = [depths.get(goal, _UNREACHABLE) for goal in targets]
+        if _UNREACHABLE in from_start:
+            return SolverResult(path=[start], explored=explored, success=False)
+
+        trees: List[_GoalTree] = []
+        for goal in targets:
+            tree = self._build_tree(state.board, goal, budget, explored)
+            if tree is None:
+                return SolverResult(
+                    path=self._partial_tour(targets, from_start, parents, trees),
+                    explored=explored,
+                    success=False,
+                    exhausted=True,
+                    lower_bound=max(from_start),
+                )
+            trees.append(tree)
+            explored += len(tree.distances)
+        matrix = [
+            [tree.distances.get(origin, _UNREACHABLE) for tree in trees]
+            for origin in targets
+        ]
+
+        order: Optional[List[int]] = None
+        exhausted = False
+        if len(targets) <= self.exact_limit:
+            order, exhausted = self._exact_order(from_start, matrix, budget, explored)
+        if order is None:
+            order = self._heuristic_order(from_start, matrix)
+        if order is None and self.exact_limit < len(targets) <= _FALLBACK_LIMIT:
+            order, exhausted = self._exact_order(from_start, matrix, budget, explored)
+        if order is None:
+            return SolverResult(path=[start], explored=explored, success=False, exhausted=exhausted)
+
+        path = CompactPath(start)
+        for index in order:
+            for position in trees[index].walk_from(path.end):
+                path.extend_to(position)
+        return SolverResult(path=path, explored=explored, success=True, exhausted=exhausted)
+
+    def _explore_from(
+        self, board: Board, start: Position, targets: Sequence[Position], budget: Optional[SearchBudget]
+    ) -> Tuple[Dict[Position, Optional[Position]], Dict[Position, int], Deque[Position]]:
+        """BFS forwards from the start until every target is found.
+
+        The returned frontier is empty unless the budget ran out first.
+        """
+
+        parents: Dict[Position, Optional[Position]] = {start: None}
+        depths: Dict[Position, int] = {start: 0}
+        missing = set(targets)
+        queue = deque([start])
+        while queue and missing:
+            if budget is not None and budget.exhausted(len(depths)):
+                return parents, depths, queue
+            current = queue.popleft()
+            for direction in self.allowed_directions:
+                following = current.move(direction)
+                if following in parents or not board.in_bounds(following) or board.is_wall(following):
+                    continue
+                parents[following] = current
+                depths[following] = depths[current] + 1
+                missing.discard(following)
+                queue.append(following)
+        return parents, depths, deque()
+
+    @staticmethod
+    def _partial_tour(
+        targets: Sequence[Position],
+        from_start: Sequence[float],
+        parents: Dict[Position, Optional[Position]],
+        trees: Sequence[_GoalTree],
+    ) -> CompactPath:
+        """Walk to the nearest target, then greedily on through the goals whose trees are built."""
+
+        first = min(range(len(targets)), key=from_start.__getitem__)
+        path = CompactPath.from_parents(targets[first], parents)
+        visited = {first}
+        while True:
+            candidates = [index for index in range(len(trees)) if index not in visited]
+            if not candidates:
+                return path
+            following = min(candidates, key=lambda index: trees[index].distances.get(path.end, _UNREACHABLE))
+            if path.end not in trees[following].distances:
+                return path
+            for position in trees[following].walk_from(path.end):
+                path.extend_to(position)
+            visited.add(following)
+
+    def _build_tree(
+        self, board: Board, goal: Position, budget: Optional[SearchBudget], explored: int
+    ) -> Optional[_GoalTree]:
+        toward: Dict[Position, Optional[Position]] = {goal: None}
+        distances: Dict[Position, int] = {goal: 0}
+        queue = deque([goal])
+        while queue:
+            if budget is not None and budget.exhausted(explored + len(distances)):
+                return None
+            current = queue.popleft()
+            for direction in self.allowed_directions:
+                dx, dy = direction.delta
+                previous = Position(current.x - dx, current.y - dy)
+                if previous in toward:
+                    continue
+                if not board.in_bounds(previous) or board.is_wall(previous):
+                    continue
+                toward[previous] = current
+                distances[previous] = distances[current] + 1
+                queue.append(previous)
+        return _GoalTree(goal, toward, distances)
+
+    @staticmethod
+    def _exact_order(
+        from_start: Sequence[float],
+        matrix: Sequence[Sequence[float]],
+        budget: Optional[SearchBudget],
+        explored: int,
+    ) -> Tuple[Optional[List[int]], bool]:
+        count = len(from_start)
+        full = (1 << count) - 1
+        costs: List[List[float]] = [[_UNREACHABLE] * count for _ in range(full + 1)]
+        parents: List[List[int]] = [[-1] * count for _ in range(full + 1)]
+        for index, distance in enumerate(from_start):
+            costs[1 << index][index] = distance
+
+        for mask in range(1, full + 1):
+            if budget is not None and budget.exhausted(explored + mask):
+                return None, True
+            row = costs[mask]
+            for last in range(count):
+                cost = row[last]
+                if cost == _UNREACHABLE:
+                    continue
+                distances = matrix[last]
+                for following in range(count):
+                    bit = 1 << following
+                    if mask & bit:
+                        continue
+                    candidate = cost + distances[following]
+                    extended = mask | bit
+                    if candidate < costs[extended][following]:
+                        costs[extended][following] = candidate
+                        parents[extended][following] = last
+
+        final = costs[full]
+        last = min(range(count), key=final.__getitem__)
+        if final[last] == _UNREACHABLE:
+            return None, False
+        order: List[int] = []
+        mask = full
+        while last != -1:
+            order.append(last)
+            previous = parents[mask][last]
+            mask ^= 1 << last
+            last = previous
+        order.reverse()
+        return order, False
+
+    @classmethod
+    def _heuristic_order(cls, from_start: Sequence[float], matrix: Sequence[Sequence[float]]) -> Optional[List[int]]:
+        # Unreachable legs cost more than any tour made of reachable legs, so the
+        # refinement below first removes them and then shortens the tour.
+        penalty = 1 + sum(distance for row in (from_start, *matrix) for distance in row if distance != _UNREACHABLE)
+
+        def leg(origin: int, target: int) -> float:
+            distance = from_start[target] if origin == -1 else matrix[origin][target]
+            return penalty if distance == _UNREACHABLE else distance
+
+        remaining = set(range(len(from_start)))
+        order: List[int] = []
+        previous = -1
+        while remaining:
+            previous = min(remaining, key=lambda target: leg(previous, target))
+            order.append(previous)
+            remaining.remove(previous)
+
+        while cls._two_opt(order, leg) or cls._or_opt(order, leg):
+            pass
+        if any(leg(origin, target) == penalty for origin, target in zip([-1, *order], order)):
+            return None
+        return order
+
+    @staticmethod
+    def _two_opt(order: List[int], leg: Callable[[int, int], float]) -> bool:
+        """Apply the first improving segment reversal, returning whether one was found.
+
+        Distances may be asymmetric when directions are restricted, so the legs inside
+        the reversed segment are re-priced in the opposite direction using prefix sums
+        of the forward and backward leg costs.
+        """
+
+        size = len(order)
+        forward, backward = [0.0], [0.0]
+        for origin, target in zip(order, order[1:]):
+            forward.append(forward[-1] + leg(origin, target))
+            backward.append(backward[-1] + leg(target, origin))
+        for first in range(size - 1):
+            before = order[first - 1] if first > 0 else -1
+            for last in range(first + 1, size):
+                delta = leg(before, order[last]) - leg(before, order[first])
+                delta += (backward[last] - backward[first]) - (forward[last] - forward[first])
+                if last + 1 < size:
+                    after = order[last + 1]
+                    delta += leg(order[first], after) - leg(order[last], after)
+                if delta < 0:
+                    order[first : last + 1] = reversed(order[first : last + 1])
+                    return True
+        return False
+
+    @staticmethod
+    def _or_opt(order: List[int], leg: Callable[[int, int], float], max_segment: int = 3) -> bool:
+        """Move the first improving segment of up to ``max_segment`` goals elsewhere, keeping its direction."""
+
+        size = len(order)
+        for length in range(1, min(max_segment, size - 1) + 1):
+            for first in range(size - length + 1):
+                segment = order[first : first + length]
+                rest = order[:first] + order[first + length :]
+                before = order[first - 1] if first > 0 else -1
+                removed = leg(before, segment[0])
+                if first + length < size:
+                    after = order[first + length]
+                    removed += leg(segment[-1], after) - leg(before, after)
+                for slot in range(len(rest) + 1):
+                    if slot == first:
+                        continue
+                    origin = rest[slot - 1] if slot > 0 else -1
+                    added = leg(origin, segment[0])
+                    if slot < len(rest):
+                        added += leg(segment[-1], rest[slot]) - leg(origin, rest[slot])
+                    if added < removed:
+                        order[:] = rest[:slot] + segment + rest[slot:]
+                        return True
+        return False
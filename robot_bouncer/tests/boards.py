@@ -0,0 +1,27 @@
+"""Random boards shared by the solver tests."""
+import random
+from typing import Tuple
+
+from robot_bouncer.core.engine import GameState
+from robot_bouncer.core.entities import Board, Direction, Position, Robot
+
+
+def random_state(
+    rng: random.Random,
+    density: float,
+    max_size: int = 20,
+    goal_count: Tuple[int, int] = (1, 3),
+    pads: int = 0,
+) -> GameState:
+    width, height = rng.randint(1, max_size), rng.randint(1, max_size)
+    start = Position(rng.randrange(width), rng.randrange(height))
+    walls = [
+        Position(x, y)
+        for x in range(width)
+        for y in range(height)
+        if rng.random() < density and Position(x, y) != start
+    ]
+    goals = [Position(rng.randrange(width), rng.randrange(height)) for _ in range(rng.randint(*goal_count))]
+    bounce_pads = [Position(rng.randrange(width), rng.randrange(height)) for _ in range(pads)]
+    board = Board(width=width, height=height, walls=walls, bounce_pads=bounce_pads)
+    return GameState(board=board, robot=Robot(position=start, direction=Direction.EAST), goals=goals)
@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+from robot_bouncer.core.engine import BounceRule, GameEngine, GameState
+from robot_bouncer.core.entities import Board, Direction, Position, Robot
+from robot_bouncer.solver.anytime import AnytimeSolver
+from robot_bouncer.solver.base import CancellationToken, SearchBudget
+from robot_bouncer.solver.bfs import BfsSolver
+from robot_bouncer.solver.jps import JpsSolver
+from robot_bouncer.solver.physics import PhysicsSolver
+from robot_bouncer.solver.tour import TourSolver
+
+from .boards import random_state
+
+ENGINE = GameEngine(rules=[BounceRule()])
+
+
+def _assert_walkable(state, path):
+    assert path[0] == state.robot.position
+    for previous, current in zip(path, path[1:]):
+        assert abs(previous.x - current.x) + abs(previous.y - current.y) == 1
+        assert state.board.in_bounds(current) and not state.board.is_wall(current)
+
+
+@pytest.mark.parametrize("solver_class", [BfsSolver, JpsSolver, AnytimeSolver])
+def test_node_budget_keeps_partial_paths_walkable_and_bounds_admissible(solver_class):
+    rng = random.Random(11)
+    for _ in range(80):
+        state = random_state(rng, 0.2, goal_count=(1, 1))
+        optimal = BfsSolver(ENGINE).solve(state)
+        for max_nodes in [1, 5, 20, 80]:
+            result = solver_class(ENGINE).solve(state, SearchBudget(max_nodes=max_nodes))
+            _assert_walkable(state, result.path)
+            if not result.exhausted:
+                assert result.success == optimal.success
+                if optimal.success:
+                    assert result.moves == optimal.moves
+                continue
+            if optimal.success:
+                assert result.lower_bound <= optimal.moves
+            if result.success:
+                assert result.path[-1] in state.goal_set
+
+
+def test_node_budget_on_tours_bounds_the_optimal_tour():
+    rng = random.Random(12)
+    for _ in range(60):
+        state = random_state(rng, 0.1, max_size=10, goal_count=(2, 4))
+        optimal = TourSolver(ENGINE).solve(state)
+        for max_nodes in [1, 10, 40, 120]:
+            result = TourSolver(ENGINE).solve(state, SearchBudget(max_nodes=max_nodes))
+            _assert_walkable(state, result.path)
+            if result.exhausted and not result.success and optimal.success and result.lower_bound is not None:
+                assert result.lower_bound <= optimal.moves
+
+
+@pytest.mark.parametrize("solver_class", [BfsSolver, JpsSolver, AnytimeSolver, TourSolver, PhysicsSolver])
+def test_cancelled_token_stops_the_search(solver_class):
+    token = CancellationToken()
+    token.cancel()
+    board = Board(width=30, height=30)
+    state = GameState(board=board, robot=Robot(Position(0, 0), Direction.EAST), goals=[Position(29, 29)])
+    result = solver_class(ENGINE).solve(state, SearchBudget(token=token, check_interval=1))
+    assert result.exhausted and not result.success
+    assert result.path[0] == Position(0, 0)
+
+
+def test_anytime_improvements_shrink_until_optimal():
+    rng = random.Random(13)
+    for _ in range(40):
+        state = random_state(rng, 0.25, max_size=25, goal_count=(1, 1))
+        optimal = BfsSolver(ENGINE).solve(state)
+        improvements = []
+        result = AnytimeSolver(ENGINE, on_improvement=improvements.append).solve(state)
+        assert result.success == optimal.success
+        if not optimal.success:
+            continue
+        moves = [improvement.moves for improvement in improvements]
+        assert all(improvement.success for improvement in improvements)
+        assert all(earlier > later for earlier, later in zip(moves, moves[1:]))
+        assert moves[-1] == optimal.moves == result.moves
@@ -0,0 +1,46 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from robot_bouncer import registry
+from robot_bouncer.cli import main
+from robot_bouncer.solver.bfs import BfsSolver
+
+STARTUP_BENCHMARK = Path(__file__).resolve().parents[2] / "benchmarks" / "startup.py"
+
+
+def test_cold_import_defers_subsystems():
+    if not STARTUP_BENCHMARK.exists():
+        pytest.skip("benchmarks are only available in a source checkout")
+    spec = importlib.util.spec_from_file_location("startup_benchmark", STARTUP_BENCHMARK)
+    startup = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(startup)
+    assert startup.deferred_modules_loaded() == []
+
+
+def test_registry_loads_registered_entries(monkeypatch):
+    assert registry.load_solver("bfs") is BfsSolver
+    with pytest.raises(LookupError, match="Unknown solver 'missing'"):
+        registry.load_solver("missing")
+    with pytest.raises(registry.UnknownEntryError):
+        registry.load_renderer("missing")
+
+    monkeypatch.setitem(registry.SOLVERS, "custom", registry.SOLVERS["bfs"])
+    registry.register_solver("custom", "robot_bouncer.solver.jps:JpsSolver")
+    assert "custom" in registry.available_solvers()
+    assert registry.load_solver("custom").__name__ == "JpsSolver"
+
+
+def test_main_exit_codes(capsys):
+    assert main(["solve", "--renderer", "none", "--goal", "4,4"]) == 0
+    assert "Solved: yes" in capsys.readouterr().out
+
+    walled = ["--wall", "3,4", "--wall", "4,3"]
+    assert main(["solve", "--renderer", "none", "--goal", "4,4", *walled]) == 1
+    assert main(["solve", "--renderer", "none", "--goal", "4,4", "--max-nodes", "1"]) == 1
+    assert "Budget exhausted: yes" in capsys.readouterr().out
+
+    assert main(["solve", "--solver", "missing"]) == 2
+    assert "Unknown solver 'missing'" in capsys.readouterr().err
+    assert main(["list"]) == 0
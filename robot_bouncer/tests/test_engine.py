@@ -0,0 +1,26 @@
+import dataclasses
+
+from robot_bouncer.core.engine import GameState
+from robot_bouncer.core.entities import Board, Direction, Position, Robot
+
+
+def _state():
+    robot = Robot(position=Position(0, 0), direction=Direction.EAST)
+    return GameState(board=Board(width=4, height=4), robot=robot, goals=[Position(3, 3)])
+
+
+def test_goals_are_stored_as_a_tuple_and_refresh_the_goal_set():
+    state = _state()
+    assert state.goals == (Position(3, 3),)
+    state.goals = [*state.goals, Position(0, 0)]
+    assert state.goal_set == {Position(3, 3), Position(0, 0)}
+    assert state.is_goal_reached()
+
+
+def test_game_state_keeps_the_dataclass_api():
+    state = _state()
+    assert [field.name for field in dataclasses.fields(state)] == ["board", "robot", "goals"]
+    moved = dataclasses.replace(state, robot=Robot(position=Position(3, 3), direction=Direction.SOUTH))
+    assert moved.goal_set == state.goal_set
+    assert moved.is_goal_reached()
+    assert dataclasses.replace(state) == state
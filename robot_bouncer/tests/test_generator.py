@@ -0,0 +1,59 @@
+import json
+import random
+
+import pytest
+
+from robot_bouncer.app import RobotBouncerApp
+from robot_bouncer.core.entities import Position
+from robot_bouncer.generator import DistanceField, PuzzleGenerator, generate_corpus
+from robot_bouncer.solver.bfs import BfsSolver
+
+
+class _OddSeedsFail(PuzzleGenerator):
+    def try_generate(self, seed):
+        return None if seed % 2 else super().try_generate(seed)
+
+
+def _fresh(field: DistanceField, width: int) -> DistanceField:
+    walls = [Position(index % width, index // width) for index in range(len(field.walls)) if field.walls[index]]
+    return DistanceField(field.width, field.height, Position(field.source % width, field.source // width), walls)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_edits_match_fresh_flood(seed):
+    rng = random.Random(seed)
+    width, height = rng.randint(2, 12), rng.randint(2, 12)
+    field = DistanceField(width, height, Position(rng.randrange(width), rng.randrange(height)))
+    for _ in range(150):
+        index = rng.randrange(width * height)
+        if index == field.source:
+            continue
+        before = (list(field.distances), field.max_distance)
+        log = field.remove_wall(index) if field.is_wall(index) else field.add_wall(index)
+        fresh = _fresh(field, width)
+        assert field.distances == fresh.distances
+        assert field.max_distance == fresh.max_distance
+        if rng.random() < 0.3:
+            field.undo(index, log)
+            assert (field.distances, field.max_distance) == before
+
+
+@pytest.mark.parametrize("depth", [4, 12, 25])
+def test_generated_puzzles_have_requested_depth(depth):
+    app = RobotBouncerApp()
+    generator = PuzzleGenerator(12, 12, depth)
+    for seed in range(5):
+        state = app.create_state(generator.generate(seed).to_config())
+        result = BfsSolver(app.build_engine()).solve(state)
+        assert result.success
+        assert result.moves == depth
+
+
+def test_failed_seeds_are_skipped_in_corpus(tmp_path):
+    with pytest.raises(RuntimeError):
+        PuzzleGenerator(4, 4, 5, attempts=0).generate(0)
+    path = tmp_path / "corpus.jsonl"
+    written = generate_corpus(path, _OddSeedsFail(8, 8, 6), 6, seed=10, workers=2)
+    seeds = [json.loads(line)["seed"] for line in path.read_text().splitlines()]
+    assert written == 3
+    assert seeds == [10, 12, 14]
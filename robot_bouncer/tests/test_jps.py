@@ -0,0 +1,38 @@
+import random
+
+import pytest
+
+from robot_bouncer.core.engine import BounceRule, GameEngine
+from robot_bouncer.solver.bfs import BfsSolver
+from robot_bouncer.solver.jps import JpsSolver
+
+from .boards import random_state
+
+
+@pytest.mark.parametrize("density", [0.0, 0.1, 0.3])
+def test_jps_matches_bfs_path_lengths(density):
+    rng = random.Random(int(density * 100))
+    engine = GameEngine(rules=[BounceRule()])
+    for _ in range(150):
+        state = random_state(rng, density)
+        expected = BfsSolver(engine).solve(state)
+        result = JpsSolver(engine).solve(state)
+        assert result.success == expected.success
+        if expected.success:
+            assert result.moves == expected.moves
+            path = result.path
+            assert path[0] == state.robot.position and path[-1] in state.goal_set
+            for previous, current in zip(path, path[1:]):
+                assert abs(previous.x - current.x) + abs(previous.y - current.y) == 1
+                assert not state.board.is_wall(current)
+
+
+def test_jps_expands_fewer_nodes_than_bfs_on_open_boards():
+    rng = random.Random(7)
+    engine = GameEngine(rules=[BounceRule()])
+    bfs_nodes = jps_nodes = 0
+    for _ in range(20):
+        state = random_state(rng, 0.05, max_size=40)
+        bfs_nodes += BfsSolver(engine).solve(state).explored
+        jps_nodes += JpsSolver(engine).solve(state).explored
+    assert jps_nodes < bfs_nodes
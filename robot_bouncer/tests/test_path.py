@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from robot_bouncer.core.entities import Direction, Position
+from robot_bouncer.solver.base import SolverResult
+from robot_bouncer.solver.path import CompactPath
+
+
+def _walk(rng, length):
+    positions = [Position(0, 0)]
+    for _ in range(length):
+        dx, dy = rng.choice(list(Direction)).delta
+        positions.append(Position(positions[-1].x + dx, positions[-1].y + dy))
+    return positions
+
+
+def test_pack_and_unpack_round_trip():
+    rng = random.Random(3)
+    for length in [0, 1, 3, 4, 5, 17, 64]:
+        path = CompactPath.from_positions(_walk(rng, length))
+        data = path.pack()
+        assert len(data) == (length + 3) // 4
+        assert CompactPath.unpack(path.start, data, path.moves) == path
+
+
+def test_from_parents_rebuilds_the_path_to_the_goal():
+    positions = [Position(0, 0), Position(1, 0), Position(2, 0), Position(2, 1), Position(2, 2), Position(1, 2)]
+    parents = {positions[0]: None}
+    parents.update(zip(positions[1:], positions))
+    path = CompactPath.from_parents(positions[-1], parents)
+    assert list(path.iter_positions()) == positions
+    assert path.runs == [(Direction.EAST, 2), (Direction.SOUTH, 2), (Direction.WEST, 1)]
+
+    jump_parents = {Position(0, 0): None, Position(3, 0): Position(0, 0), Position(3, 2): Position(3, 0)}
+    jumped = CompactPath.from_parents(Position(3, 2), jump_parents)
+    assert (jumped.moves, jumped.end) == (5, Position(3, 2))
+
+
+def test_iter_runs_yields_run_destinations():
+    path = CompactPath(Position(1, 1), [(Direction.EAST, 3), (Direction.NORTH, 1), (Direction.EAST, 2)])
+    assert list(path.iter_runs()) == [
+        (Direction.EAST, 3, Position(4, 1)),
+        (Direction.NORTH, 1, Position(4, 0)),
+        (Direction.EAST, 2, Position(6, 0)),
+    ]
+    assert path.end == Position(6, 0) and path.moves == 6
+
+
+def test_empty_path():
+    with pytest.raises(ValueError):
+        CompactPath.from_positions([])
+    result = SolverResult(path=[])
+    assert result.to_compact() is None
+    assert list(result.iter_run_commands()) == []
+    assert result.to_commands() == []
+    assert (result.moves, result.final_position) == (0, None)
+    assert "steps=0" in repr(result)
+
+
+def test_mutating_a_materialized_path_updates_every_accessor():
+    result = SolverResult(path=CompactPath(Position(0, 0), [(Direction.EAST, 2)]))
+    result.path.append(Position(2, 1))
+    assert result.compact is None
+    assert (result.moves, result.final_position) == (3, Position(2, 1))
+    assert "steps=4" in repr(result)
+    assert list(result.iter_run_commands()) == ["Move East x2 to (2, 0)", "Move South x1 to (2, 1)"]
+    assert result.to_commands()[-1] == "Move South to (2, 1)"
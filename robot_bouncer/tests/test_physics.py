@@ -0,0 +1,23 @@
+import random
+
+from robot_bouncer.core.engine import BounceRule, GameEngine
+from robot_bouncer.solver.physics import PhysicsSolver
+
+from .boards import random_state
+
+
+def test_physics_plan_replays_to_a_goal():
+    rng = random.Random(11)
+    engine = GameEngine(rules=[BounceRule()])
+    solved = 0
+    for _ in range(100):
+        state = random_state(rng, 0.15, pads=1)
+        result = PhysicsSolver(engine).solve(state)
+        if not result.success:
+            assert result.launch_direction is None
+            continue
+        solved += 1
+        PhysicsSolver(engine).apply_solution(state, result)
+        assert state.is_goal_reached()
+        assert state.robot.position == result.final_position
+    assert solved > 0
@@ -0,0 +1,85 @@
+import random
+import struct
+import zlib
+
+import pytest
+
+from robot_bouncer.core.engine import GameState
+from robot_bouncer.core.entities import Board, Direction, Position, Robot
+from robot_bouncer.visuals.raster import RasterRenderer, _lzw_encode
+
+
+def _lzw_decode(data, min_code_size):
+    clear_code = 1 << min_code_size
+    end_code = clear_code + 1
+    bits = int.from_bytes(data, "little")
+    offset = 0
+    output = bytearray()
+    table = []
+    code_size = min_code_size + 1
+    previous = None
+    while True:
+        code = bits >> offset & ((1 << code_size) - 1)
+        offset += code_size
+        if code == clear_code:
+            table = [bytes((value,)) for value in range(clear_code)] + [b"", b""]
+            code_size = min_code_size + 1
+            previous = None
+            continue
+        if code == end_code:
+            return bytes(output)
+        if previous is None:
+            entry = table[code]
+        else:
+            entry = table[code] if code < len(table) else previous + previous[:1]
+            table.append(previous + entry[:1])
+            if len(table) == 1 << code_size and code_size < 12:
+                code_size += 1
+        output += entry
+        previous = entry
+
+
+def _state():
+    board = Board(width=5, height=3, walls=[Position(2, 1)], bounce_pads=[Position(4, 0)])
+    return GameState(board=board, robot=Robot(Position(0, 0), Direction.EAST), goals=[Position(4, 2)])
+
+
+@pytest.mark.parametrize("length", [1, 2, 100, 5000, 40000])
+def test_lzw_round_trip(length):
+    rng = random.Random(length)
+    noise = bytes(rng.randrange(8) for _ in range(length))
+    runs = bytes(rng.randrange(8) for _ in range(length // 50 + 1) for _ in range(50))[:length]
+    for pixels in (noise, runs):
+        assert _lzw_decode(_lzw_encode(pixels, 3), 3) == pixels
+
+
+def test_png_chunks_have_valid_crcs_and_size():
+    renderer = RasterRenderer(cell_size=6)
+    state = _state()
+    data = renderer._encode_png(*renderer.frame_size(state.board), renderer.render_indexed(state))
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    offset = 8
+    chunks = {}
+    while offset < len(data):
+        (length,) = struct.unpack(">I", data[offset : offset + 4])
+        kind = data[offset + 4 : offset + 8]
+        payload = data[offset + 8 : offset + 8 + length]
+        (crc,) = struct.unpack(">I", data[offset + 8 + length : offset + 12 + length])
+        assert crc == zlib.crc32(kind + payload)
+        chunks[kind] = payload
+        offset += 12 + length
+    assert list(chunks) == [b"IHDR", b"PLTE", b"IDAT", b"IEND"]
+    width, height = struct.unpack(">II", chunks[b"IHDR"][:8])
+    assert (width, height) == renderer.frame_size(state.board)
+    assert len(zlib.decompress(chunks[b"IDAT"])) == height * (width + 1)
+
+
+def test_path_frames_leave_the_state_untouched(tmp_path):
+    renderer = RasterRenderer(cell_size=4)
+    state = _state()
+    path = [Position(0, 0), Position(1, 0), Position(2, 0), Position(3, 0)]
+    frames = [frame.robot.position for frame in renderer.iter_path_frames(state, path)]
+    assert frames == path
+    assert state.robot.position == Position(0, 0)
+    assert renderer.export_gif(renderer.iter_path_frames(state, path), tmp_path / "path.gif") == len(path)
+    assert state.robot.position == Position(0, 0)
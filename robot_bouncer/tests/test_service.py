@@ -0,0 +1,104 @@
+import asyncio
+import json
+import threading
+
+from robot_bouncer.interfaces.service import SolveService
+from robot_bouncer.solver.bfs import BfsSolver
+
+CONFIG = {"width": 7, "height": 5, "walls": [[3, 0]], "goals": [[6, 4]]}
+
+
+class _GatedSolver(BfsSolver):
+    gate = threading.Event()
+
+    def solve(self, state, budget=None):
+        self.gate.wait(5)
+        return super().solve(state, budget)
+
+
+class _Writer:
+    def __init__(self):
+        self.data = bytearray()
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        pass
+
+    async def wait_closed(self):
+        pass
+
+
+def _exchange(service, payloads):
+    async def run():
+        reader = asyncio.StreamReader()
+        for payload in payloads:
+            reader.feed_data((payload if isinstance(payload, str) else json.dumps(payload)).encode() + b"\n")
+        reader.feed_eof()
+        writer = _Writer()
+        await service.handle_connection(reader, writer)
+        return [json.loads(line) for line in writer.data.splitlines()]
+
+    return asyncio.run(run())
+
+
+def test_identical_requests_share_one_solve():
+    service = SolveService(solver_factory=_GatedSolver)
+    count = 6
+
+    async def run():
+        tasks = [asyncio.create_task(service.solve({"id": index, "config": CONFIG})) for index in range(count)]
+        while service.metrics.requests < count:
+            await asyncio.sleep(0)
+        _GatedSolver.gate.set()
+        return await asyncio.gather(*tasks)
+
+    try:
+        responses = asyncio.run(run())
+    finally:
+        _GatedSolver.gate.clear()
+        service.close()
+    assert service.metrics.solves == 1
+    assert service.metrics.coalesced == count - 1
+    assert [response["id"] for response in responses] == list(range(count))
+    assert all(response["success"] and response["path"][-1] == [6, 4] for response in responses)
+
+
+def test_error_lines_keep_their_id():
+    service = SolveService()
+    try:
+        responses = _exchange(service, [{"id": 7, "op": "bogus"}, "not json", {"id": 3, "config": CONFIG}])
+    finally:
+        service.close()
+    by_id = {response.get("id"): response for response in responses}
+    assert "Unknown op" in by_id[7]["error"]
+    assert "error" in by_id[None]
+    assert by_id[3]["success"]
+    assert service.metrics.errors == 2
+
+
+def test_stats_reports_counters_and_latency():
+    service = SolveService()
+    try:
+        responses = _exchange(service, [{"id": 1, "config": CONFIG}])
+        (stats,) = _exchange(service, [{"op": "stats"}])
+    finally:
+        service.close()
+    assert responses[0]["id"] == 1
+    assert set(stats) == {
+        "requests",
+        "solves",
+        "coalesced",
+        "errors",
+        "queue_depth",
+        "uptime_s",
+        "throughput_rps",
+        "latency_ms",
+    }
+    assert (stats["requests"], stats["solves"], stats["errors"], stats["queue_depth"]) == (1, 1, 0, 0)
+    assert set(stats["latency_ms"]) == {"p50", "p90", "p99"}
+    assert stats["latency_ms"]["p50"] > 0
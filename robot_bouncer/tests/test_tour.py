@@ -0,0 +1,65 @@
+import itertools
+import random
+from collections import deque
+
+import pytest
+
+from robot_bouncer.core.engine import BounceRule, GameEngine
+from robot_bouncer.core.entities import Direction
+from robot_bouncer.solver.tour import TourSolver
+
+from .boards import random_state
+
+RESTRICTED = [Direction.EAST, Direction.SOUTH, Direction.NORTH]
+
+
+def _distances(board, origin, directions):
+    distances = {origin: 0}
+    queue = deque([origin])
+    while queue:
+        current = queue.popleft()
+        for direction in directions:
+            following = current.move(direction)
+            if following in distances or not board.in_bounds(following) or board.is_wall(following):
+                continue
+            distances[following] = distances[current] + 1
+            queue.append(following)
+    return distances
+
+
+def _brute_force_tour(state, directions):
+    start = state.robot.position
+    goals = [goal for goal in dict.fromkeys(state.goals) if goal != start]
+    distances = {origin: _distances(state.board, origin, directions) for origin in [start, *goals]}
+    best = None
+    for order in itertools.permutations(goals):
+        legs = zip([start, *order], order)
+        length = sum(distances[origin].get(target, float("inf")) for origin, target in legs)
+        best = length if best is None else min(best, length)
+    return best
+
+
+@pytest.mark.parametrize("exact_limit", [16, 0])
+def test_tour_length_matches_brute_force_with_restricted_directions(exact_limit):
+    rng = random.Random(5)
+    engine = GameEngine(rules=[BounceRule()])
+    solved = 0
+    for _ in range(150):
+        state = random_state(rng, 0.2, max_size=10, goal_count=(2, 5))
+        state.board.walls = [wall for wall in state.board.walls if wall not in state.goal_set]
+        optimum = _brute_force_tour(state, RESTRICTED)
+        result = TourSolver(engine, RESTRICTED, exact_limit=exact_limit).solve(state)
+        assert result.success == (optimum != float("inf"))
+        if not result.success:
+            continue
+        solved += 1
+        path = result.path
+        assert set(state.goals) <= set(path)
+        for previous, current in zip(path, path[1:]):
+            delta = (current.x - previous.x, current.y - previous.y)
+            assert delta in [direction.delta for direction in RESTRICTED]
+        if exact_limit:
+            assert result.moves == optimum
+        else:
+            assert result.moves >= optimum
+    assert solved > 0
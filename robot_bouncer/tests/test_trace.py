@@ -0,0 +1,33 @@
+import random
+
+from robot_bouncer.core.engine import BounceRule, GameEngine, GameState
+from robot_bouncer.core.entities import Board, Direction, Position, Robot
+from robot_bouncer.core.trace import TraceReader, TraceRecorder
+
+
+def test_recorded_states_round_trip(tmp_path):
+    rng = random.Random(3)
+    board = Board(width=9, height=7, walls=[Position(4, 3), Position(2, 5)], bounce_pads=[Position(6, 1)])
+    state = GameState(board=board, robot=Robot(position=Position(0, 0), direction=Direction.EAST), goals=[])
+    engine = GameEngine(rules=[BounceRule()])
+    path = tmp_path / "run.rbt"
+
+    recorded = []
+    with TraceRecorder(path, board, [Position(8, 6)], checkpoint_interval=16) as recorder:
+        for step in range(200):
+            if step % 37 == 0:
+                # Teleport now and then to exercise the full-state escape records.
+                state.robot.position = Position(rng.randrange(board.width), rng.randrange(board.height))
+            recorder.record(state)
+            recorded.append((state.robot.position, state.robot.direction))
+            engine.step(state)
+
+    with TraceReader(path) as reader:
+        assert len(reader) == len(recorded)
+        assert reader.goals == [Position(8, 6)]
+        assert reader.board.walls == board.walls
+        for step in rng.sample(range(len(recorded)), 50) + [0, -1]:
+            snapshot = reader[step]
+            assert (snapshot.robot.position, snapshot.robot.direction) == recorded[step]
+        streamed = [(item.robot.position, item.robot.direction) for item in reader.iter_states(20, 90)]
+        assert streamed == recorded[20:90]
@@ -1,7 +1,29 @@
 """Rendering backends for Robot Bouncer."""
-from .base import GameRenderer
-from .console import ConsoleRenderer
-from .grid import InteractiveBoard
-from .pyqt import PyQtRenderer
+from __future__ import annotations
 
-__all__ = ["GameRenderer", "ConsoleRenderer", "InteractiveBoard", "PyQtRenderer"]
+from robot_bouncer._lazy import lazy_exports
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .base import GameRenderer
+    from .console import ConsoleRenderer
+    from .grid import InteractiveBoard
+    from .pyqt import PyQtRenderer
+    from .raster import RasterRenderer
+
+_EXPORTS = {
+    "GameRenderer": ".base",
+    "ConsoleRenderer": ".console",
+    "InteractiveBoard": ".grid",
+    "PyQtRenderer": ".pyqt",
+    "RasterRenderer": ".raster",
+}
+
+__all__ = [
+    "GameRenderer",
+    "ConsoleRenderer",
+    "InteractiveBoard",
+    "PyQtRenderer",
+    "RasterRenderer",
+]
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
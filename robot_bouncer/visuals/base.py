@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Iterable, Protocol
+from typing import Iterable, Iterator, Protocol
 
 from robot_bouncer.core.engine import GameState
 
@@ -32,3 +32,9 @@ class GameRenderer(ABC):
         self.display(state)
         for command in commands:
             print(command)
+
+    def render_frames(self, frames: Iterable[GameState]) -> Iterator[str]:
+        """Lazily render a stream of states, such as :meth:`TraceReader.iter_states`."""
+
+        for frame in frames:
+            yield self.render(frame)
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from importlib import import_module
 from importlib.util import find_spec
 from typing import Iterable, List, Optional, Sequence
@@ -21,8 +22,9 @@ class _QtBindings:
     frame_box: object
 
 
+@lru_cache(maxsize=None)
 def _load_pyqt() -> _QtBindings:
-    """Load PyQt6 or PyQt5 and expose a unified interface."""
+    """Load PyQt6 or PyQt5 once per process and expose a unified interface."""
 
     if find_spec("PyQt6") is not None:
         QtWidgets = import_module("PyQt6.QtWidgets")
@@ -0,0 +1,385 @@
+"""Headless raster renderer writing frames into preallocated byte buffers."""
+from __future__ import annotations
+
+import struct
+import zlib
+from dataclasses import replace
+from importlib import import_module
+from pathlib import Path
+from typing import BinaryIO, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from robot_bouncer.core.engine import GameState
+from robot_bouncer.core.entities import Board, Position
+
+from .base import GameRenderer
+
+Color = Tuple[int, int, int]
+
+TILE_KINDS = ("empty", "grid", "wall", "pad", "goal", "path", "robot", "unused")
+DEFAULT_COLORS: Dict[str, Color] = {
+    "empty": (245, 245, 240),
+    "grid": (200, 200, 195),
+    "wall": (40, 40, 48),
+    "pad": (80, 160, 230),
+    "goal": (240, 190, 40),
+    "path": (150, 220, 150),
+    "robot": (220, 60, 60),
+    "unused": (0, 0, 0),
+}
+_INDEX = {kind: index for index, kind in enumerate(TILE_KINDS)}
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+class RasterRenderer(GameRenderer):
+    """Rasterize boards into palette-indexed and RGB byte buffers without a display.
+
+    The static layer (floor, grid lines, walls, pads and goals) is drawn once per
+    board and cached. Each frame then copies that layer into a preallocated buffer
+    and only blits the path tiles and the robot. Every tile row is a contiguous
+    slice, so drawing is done with slice assignments instead of per-pixel loops.
+
+    Frames can be exported as PNG files or as an animated GIF using only the standard
+    library. :meth:`render_array` returns a NumPy array when NumPy is installed.
+    """
+
+    def __init__(self, cell_size: int = 16, colors: Optional[Dict[str, Color]] = None, grid: bool = True):
+        if cell_size < 3:
+            raise ValueError("Cell size must be at least 3 pixels.")
+        self.cell_size = cell_size
+        self.grid = grid
+        self.colors = {**DEFAULT_COLORS, **(colors or {})}
+        self.palette = [self.colors[kind] for kind in TILE_KINDS]
+        self._channel_tables = [
+            bytes(self.palette[index][channel] if index < len(self.palette) else 0 for index in range(256))
+            for channel in range(3)
+        ]
+        self._static_key: Optional[Hashable] = None
+        self._static_layer = bytearray()
+        self._indexed = bytearray()
+        self._rgb = bytearray()
+        self._fills = [memoryview(bytes((index,)) * cell_size) for index in range(len(TILE_KINDS))]
+        margin = max(1, cell_size // 4)
+        self._path_spans = self._rect_spans(margin, margin, margin, margin)
+        self._robot_spans = self._disk_spans()
+        self._tile_spans = self._rect_spans(1, 1, 0, 0) if grid else self._rect_spans(0, 0, 0, 0)
+
+    def frame_size(self, board: Board) -> Tuple[int, int]:
+        return board.width * self.cell_size, board.height * self.cell_size
+
+    def render(self, state: GameState) -> str:
+        width, height = self.frame_size(state.board)
+        self.render_indexed(state)
+        return f"Raster frame {width}x{height} ({width * height * 3} RGB bytes)"
+
+    def render_indexed(self, state: GameState, path: Sequence[Position] = ()) -> bytearray:
+        """Draw ``state`` as one palette index per pixel into the shared frame buffer."""
+
+        static = self._static(state)
+        if len(self._indexed) != len(static):
+            self._indexed = bytearray(len(static))
+        frame = self._indexed
+        frame[:] = static
+        board = state.board
+        for position in path:
+            if board.in_bounds(position):
+                self._blit(frame, board, position, self._path_spans, _INDEX["path"])
+        if board.in_bounds(state.robot.position):
+            self._blit(frame, board, state.robot.position, self._robot_spans, _INDEX["robot"])
+        return frame
+
+    def render_rgb(self, state: GameState, path: Sequence[Position] = ()) -> bytearray:
+        """Draw ``state`` as packed RGB bytes into the shared frame buffer."""
+
+        indexed = self.render_indexed(state, path)
+        if len(self._rgb) != 3 * len(indexed):
+            self._rgb = bytearray(3 * len(indexed))
+        rgb = self._rgb
+        for channel, table in enumerate(self._channel_tables):
+            rgb[channel::3] = indexed.translate(table)
+        return rgb
+
+    def render_array(self, state: GameState, path: Sequence[Position] = ()) -> object:
+        """Return the frame as a ``(height, width, 3)`` NumPy array (requires NumPy)."""
+
+        numpy = import_module("numpy")
+        width, height = self.frame_size(state.board)
+        return numpy.frombuffer(self.render_rgb(state, path), dtype=numpy.uint8).reshape(height, width, 3).copy()
+
+    def iter_path_frames(self, state: GameState, path: Iterable[Position]) -> Iterator[GameState]:
+        """Yield one state per path tile with the robot moved along the path.
+
+        The robot is moved on a private copy of ``state``, which is yielded for every
+        tile, so ``state`` itself is left untouched.
+        """
+
+        frame = replace(state, robot=replace(state.robot))
+        for position in path:
+            frame.robot.position = position
+            yield frame
+
+    def write_png(self, target: Union[str, Path, BinaryIO], state: GameState, path: Sequence[Position] = ()) -> None:
+        width, height = self.frame_size(state.board)
+        data = self._encode_png(width, height, self.render_indexed(state, path))
+        if hasattr(target, "write"):
+            target.write(data)
+        else:
+            Path(target).write_bytes(data)
+
+    def export_png_sequence(
+        self,
+        frames: Iterable[GameState],
+        directory: Union[str, Path],
+        prefix: str = "frame",
+        trail: bool = True,
+    ) -> List[Path]:
+        """Write every frame to ``directory`` as numbered PNG files and return their paths."""
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        written: List[Path] = []
+        for number, (frame, canvas, _) in enumerate(self._iter_frame_updates(frames, trail)):
+            width, height = self.frame_size(frame.board)
+            target = directory / f"{prefix}_{number:05d}.png"
+            target.write_bytes(self._encode_png(width, height, canvas))
+            written.append(target)
+        return written
+
+    def export_gif(
+        self,
+        frames: Iterable[GameState],
+        target: Union[str, Path, BinaryIO],
+        delay: int = 10,
+        loop: bool = True,
+        trail: bool = True,
+    ) -> int:
+        """Write the frames as an animated GIF, ``delay`` in hundredths of a second per frame.
+
+        Only the first frame is encoded in full. Every following frame covers the
+        bounding box of the tiles that changed and is drawn over the previous one
+        (disposal method 1), so the encoding cost follows the robot rather than the
+        board size. Frames are written to ``target`` as they are encoded.
+        """
+
+        stream: Optional[BinaryIO] = None
+        owned = False
+        count = 0
+        try:
+            for frame, canvas, box in self._iter_frame_updates(frames, trail):
+                width, height = self.frame_size(frame.board)
+                if stream is None:
+                    owned = not hasattr(target, "write")
+                    stream = open(target, "wb") if owned else target
+                    stream.write(b"GIF89a" + struct.pack("<HHBBB", width, height, 0xF2, 0, 0))
+                    stream.write(b"".join(bytes(color) for color in self.palette))
+                    if loop:
+                        stream.write(b"\x21\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00")
+                left, top, right, bottom = box or (0, 0, width, height)
+                pixels = self._crop(canvas, width, left, top, right, bottom)
+                stream.write(struct.pack("<BBBBHBB", 0x21, 0xF9, 4, 1 << 2, delay, 0, 0))
+                stream.write(struct.pack("<BHHHHB", 0x2C, left, top, right - left, bottom - top, 0))
+                stream.write(bytes((3,)) + self._gif_blocks(_lzw_encode(pixels, 3)))
+                count += 1
+            if stream is None:
+                raise ValueError("At least one frame is required to write a GIF.")
+            stream.write(b"\x3b")
+        finally:
+            if owned and stream is not None:
+                stream.close()
+        return count
+
+    def _iter_frame_updates(
+        self, frames: Iterable[GameState], trail: bool
+    ) -> Iterator[Tuple[GameState, bytearray, Optional[Tuple[int, int, int, int]]]]:
+        """Draw frames incrementally, yielding the canvas and the changed pixel box.
+
+        The trail is kept in a persistent layer on top of the static board, so each
+        frame only restores the robot's previous tile and draws its new one. The box
+        is ``(left, top, right, bottom)``, or ``None`` when the whole frame was redrawn.
+        """
+
+        source: Optional[bytearray] = None
+        layer = bytearray()
+        canvas = bytearray()
+        previous: Optional[Position] = None
+        for frame in frames:
+            board = frame.board
+            position = frame.robot.position
+            static = self._static(frame)
+            if static is not source:
+                source = static
+                layer = bytearray(static)
+                canvas = bytearray(static)
+                previous = None
+            dirty: List[Position] = []
+            if previous is not None and board.in_bounds(previous):
+                if trail:
+                    self._blit(layer, board, previous, self._path_spans, _INDEX["path"])
+                self._restore(canvas, layer, board, previous)
+                dirty.append(previous)
+            if board.in_bounds(position):
+                self._blit(canvas, board, position, self._robot_spans, _INDEX["robot"])
+                dirty.append(position)
+            yield frame, canvas, None if previous is None else self._tile_box(dirty)
+            previous = position
+
+    def _restore(self, canvas: bytearray, layer: bytearray, board: Board, position: Position) -> None:
+        size = self.cell_size
+        stride = board.width * size
+        origin = position.y * size * stride + position.x * size
+        for row in range(size):
+            begin = origin + row * stride
+            canvas[begin : begin + size] = layer[begin : begin + size]
+
+    def _tile_box(self, tiles: Sequence[Position]) -> Tuple[int, int, int, int]:
+        if not tiles:
+            return (0, 0, 1, 1)
+        size = self.cell_size
+        xs = [tile.x for tile in tiles]
+        ys = [tile.y for tile in tiles]
+        return (min(xs) * size, min(ys) * size, (max(xs) + 1) * size, (max(ys) + 1) * size)
+
+    @staticmethod
+    def _crop(canvas: bytearray, width: int, left: int, top: int, right: int, bottom: int) -> bytes:
+        if left == 0 and right == width:
+            return bytes(canvas[top * width : bottom * width])
+        return b"".join(canvas[row * width + left : row * width + right] for row in range(top, bottom))
+
+    def _static(self, state: GameState) -> bytearray:
+        board = state.board
+        key = (
+            board.width,
+            board.height,
+            frozenset(board.walls),
+            frozenset(board.bounce_pads),
+            state.goal_set,
+        )
+        if key == self._static_key:
+            return self._static_layer
+
+        width, height = self.frame_size(board)
+        layer = bytearray(bytes((_INDEX["grid" if self.grid else "empty"],)) * (width * height))
+        if self.grid:
+            for position in board.iter_tiles():
+                self._blit(layer, board, position, self._tile_spans, _INDEX["empty"])
+        for kind, positions in (("wall", board.walls), ("pad", board.bounce_pads), ("goal", state.goal_set)):
+            for position in positions:
+                if board.in_bounds(position):
+                    self._blit(layer, board, position, self._tile_spans, _INDEX[kind])
+        self._static_key = key
+        self._static_layer = layer
+        return layer
+
+    def _blit(
+        self,
+        frame: bytearray,
+        board: Board,
+        position: Position,
+        spans: Sequence[Tuple[int, int]],
+        index: int,
+    ) -> None:
+        size = self.cell_size
+        stride = board.width * size
+        origin = position.y * size * stride + position.x * size
+        fill = self._fills[index]
+        for row, (start, length) in enumerate(spans):
+            if length:
+                begin = origin + row * stride + start
+                frame[begin : begin + length] = fill[:length]
+
+    def _rect_spans(self, top: int, left: int, bottom: int, right: int) -> List[Tuple[int, int]]:
+        """Per-row ``(start, length)`` spans of a rectangle inset from the tile edges."""
+
+        size = self.cell_size
+        return [(left, size - left - right) if top <= row < size - bottom else (0, 0) for row in range(size)]
+
+    def _disk_spans(self) -> List[Tuple[int, int]]:
+        size = self.cell_size
+        radius = (size - 2) / 2
+        center = (size - 1) / 2
+        spans: List[Tuple[int, int]] = []
+        for row in range(size):
+            dy = row - center
+            if abs(dy) > radius:
+                spans.append((0, 0))
+                continue
+            half = (radius * radius - dy * dy) ** 0.5
+            start = max(0, int(round(center - half)))
+            end = min(size, int(round(center + half)) + 1)
+            spans.append((start, end - start))
+        return spans
+
+    def _encode_png(self, width: int, height: int, pixels: bytearray) -> bytes:
+        rows = b"".join(b"\x00" + pixels[row * width : (row + 1) * width] for row in range(height))
+        palette = b"".join(bytes(color) for color in self.palette)
+        return b"".join(
+            (
+                _PNG_SIGNATURE,
+                _png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 3, 0, 0, 0)),
+                _png_chunk(b"PLTE", palette),
+                _png_chunk(b"IDAT", zlib.compress(rows, 6)),
+                _png_chunk(b"IEND", b""),
+            )
+        )
+
+    @staticmethod
+    def _gif_blocks(data: bytes) -> bytes:
+        blocks = []
+        for offset in range(0, len(data), 255):
+            block = data[offset : offset + 255]
+            blocks.append(bytes((len(block),)) + block)
+        return b"".join(blocks) + b"\x00"
+
+
+def _png_chunk(kind: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I", len(payload)) + kind + payload + struct.pack(">I", zlib.crc32(kind + payload))
+
+
+def _lzw_encode(pixels: bytes, min_code_size: int) -> bytes:
+    """GIF-flavoured LZW with variable code width, mirroring giflib's encoder."""
+
+    clear_code = 1 << min_code_size
+    end_code = clear_code + 1
+    code_size = min_code_size + 1
+    next_code = end_code + 1
+    table: Dict[int, int] = {}
+    output = bytearray()
+    bits = clear_code
+    bit_count = code_size
+
+    iterator = iter(pixels)
+    prefix = next(iterator)
+    for value in iterator:
+        key = prefix << 8 | value
+        code = table.get(key)
+        if code is not None:
+            prefix = code
+            continue
+        bits |= prefix << bit_count
+        bit_count += code_size
+        while bit_count >= 8:
+            output.append(bits & 0xFF)
+            bits >>= 8
+            bit_count -= 8
+        if next_code >= 1 << code_size and code_size < 12:
+            code_size += 1
+        if next_code >= 4095:
+            bits |= clear_code << bit_count
+            bit_count += code_size
+            table.clear()
+            next_code = end_code + 1
+            code_size = min_code_size + 1
+        else:
+            table[key] = next_code
+            next_code += 1
+        prefix = value
+
+    for code in (prefix, end_code):
+        bits |= code << bit_count
+        bit_count += code_size
+        if next_code >= 1 << code_size and code_size < 12:
+            code_size += 1
+    while bit_count > 0:
+        output.append(bits & 0xFF)
+        bits >>= 8
+        bit_count -= 8
+    return bytes(output)